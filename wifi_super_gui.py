@@ -53,40 +53,67 @@ Dependencies:
     * PyYAML (``pip install pyyaml``)
     * psutil (``pip install psutil``)
     * matplotlib (``pip install matplotlib``)
+    * numpy (installed with matplotlib; chart ring buffers)
     * iperf3 (optional for throughput tests; ``pip install iperf3``)
+    * icmplib (optional for faster in‑process pings; ``pip install icmplib``)
 
 Copyright 2025.  Distributed under the MIT Licence.
 """
 
+import atexit
 import base64
+import bisect
+import copy
 import csv
+import functools
+import hashlib
+import heapq
 import io
+import itertools
+import mmap
 import json
+import operator
 import os
 import queue
 import re
 import subprocess
 import threading
 import time
+import types
 import urllib.request
+import uuid
 import zipfile
-from collections import deque
-from datetime import datetime, timedelta, timezone
+from collections import Counter, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Callable
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Callable
 
 # math is used for NaN checks and dynamic axis scaling in charts
 import math
 
 # External dependencies
+import numpy as np
 import psutil
 import yaml
 
+try:
+    # The libyaml‑backed loader/dumper are several times faster than the
+    # pure‑Python ones; PyYAML only uses them when asked explicitly.
+    from yaml import CSafeLoader as _YLoad, CSafeDumper as _YDump
+except ImportError:
+    from yaml import SafeLoader as _YLoad, SafeDumper as _YDump
+
 try:
     import iperf3  # optional: used for throughput tests if installed
 except ImportError:
     iperf3 = None
 
+try:
+    import icmplib  # optional: native ICMP pings without spawning ping.exe
+except ImportError:
+    icmplib = None
+
 try:
     # Optional library for native Windows notifications.  If not available,
     # notifications will fall back to Tkinter message boxes.
@@ -94,6 +121,11 @@ try:
 except ImportError:
     notification = None  # type: ignore
 
+try:
+    from PIL import Image  # optional: palette PNGs for report charts
+except ImportError:
+    Image = None
+
 # Tkinter imports
 import tkinter as tk
 from tkinter import filedialog, messagebox
@@ -107,20 +139,67 @@ from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 # Configuration Handling
 ################################################################################
 
+# Files next to this script, resolved once at import
+_HERE = Path(__file__).resolve().parent
+_CFG_PATH = _HERE / "config.yaml"
+_DB_PATH = _HERE / "troubleshooting_database.yaml"
+
 def deep_update(d: Dict, u: Dict) -> Dict:
     """Recursively update a nested dictionary ``d`` with ``u``.
 
     Values in ``u`` override those in ``d``.  When both values are dicts, the
-    update is performed recursively.  Returns ``d`` for convenience.
+    nested dicts are merged as well.  Nesting is walked with an explicit
+    stack rather than recursive calls.  Returns ``d`` for convenience.
     """
-    for k, v in u.items():
-        if isinstance(v, dict) and isinstance(d.get(k), dict):
-            deep_update(d[k], v)
-        else:
-            d[k] = v
+    stack = [(d, u)]
+    while stack:
+        dd, uu = stack.pop()
+        for k, v in uu.items():
+            dv = dd.get(k)
+            # PyYAML and the defaults only ever produce plain dicts
+            if type(v) is dict and type(dv) is dict:
+                stack.append((dv, v))
+            else:
+                dd[k] = v
     return d
 
 
+def _load_yaml_cached(path: Path) -> object:
+    """Parse ``path`` as YAML, reusing a JSON sidecar when the file is unchanged.
+
+    The sidecar (``<name>.cache.json``) stores the parsed data together with
+    the modification time and size of the YAML file.  When both still match,
+    the JSON copy is loaded instead, which is much faster than running the
+    YAML parser.  Otherwise the YAML is parsed (with the libyaml loader when
+    available) and the sidecar is refreshed, unless the data would not
+    survive a JSON round trip unchanged.  Problems with the cache itself
+    are ignored; YAML parse errors propagate to the caller.
+    """
+    st = path.stat()
+    key = [st.st_mtime_ns, st.st_size]
+    cache_path = path.with_name(path.name + ".cache.json")
+    try:
+        with cache_path.open("r", encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached.get("key") == key:
+            return cached.get("data")
+    except Exception:
+        pass
+    with path.open("r", encoding="utf-8") as f:
+        data = yaml.load(f, Loader=_YLoad)
+    try:
+        # Serialise first so a value JSON cannot represent never leaves a
+        # truncated sidecar behind.
+        text = json.dumps({"key": key, "data": data})
+        # JSON turns int and bool mapping keys into strings; only cache data
+        # that reads back exactly as the YAML parser returned it
+        if json.loads(text)["data"] == data:
+            cache_path.write_text(text, encoding="utf-8")
+    except Exception:
+        pass
+    return data
+
+
 def load_config() -> Dict:
     """Load configuration from ``config.yaml`` located next to this script.
 
@@ -140,6 +219,13 @@ def load_config() -> Dict:
             "remote": "8.8.8.8",
         },
         "ping_count": 4,
+        # Keep scanning nearby networks while the Channels tab is hidden
+        # (the scan is otherwise skipped; it only feeds that tab)
+        "scan_networks_when_hidden": False,
+        # Write every JSONL record in full.  When off, a repeated scan is
+        # logged as "unchanged" and disconnected samples without scan data
+        # are left to the CSV log.
+        "verbose_jsonl": False,
         "log_retention_days": 14,
         "max_log_mb": 512,
         # Appearance settings
@@ -147,6 +233,9 @@ def load_config() -> Dict:
             "theme": "light",  # options: light, dark
             "accent_color": "#0066cc",
             "font_size": 10,
+            # Redraw the dashboard charts on every Nth sample; badges
+            # still update on every sample.
+            "chart_update_every_n_scans": 1,
         },
         # Dashboard element toggles
         "dashboard_layout": {
@@ -172,6 +261,8 @@ def load_config() -> Dict:
             "loss_threshold": 20,
             "latency_threshold": 200,
             "channels": ["popup"],  # supported: popup (Tk), plyer, email, slack
+            # Repeat a notification of the same kind at most this often
+            "min_interval_sec": 30,
         },
         # Speed test settings
         "speed_test": {
@@ -180,7 +271,7 @@ def load_config() -> Dict:
             "url": "http://speedtest.tele2.net/1MB.zip",
             "iperf3_server": "",
             "iperf3_port": 5201,
-            "duration": 10,  # seconds for iperf3
+            "duration": 10,  # seconds for iperf3; cap for HTTP downloads
         },
         # Scheduled diagnostics
         "scheduled_diagnostics": {
@@ -188,37 +279,94 @@ def load_config() -> Dict:
             "interval_hours": 12,
         },
     }
-    cfg_path = Path(__file__).with_name("config.yaml")
-    if cfg_path.exists():
-        try:
-            with cfg_path.open("r", encoding="utf-8") as f:
-                user_cfg: Dict = yaml.safe_load(f) or {}
-            deep_update(defaults, user_cfg)
-        except yaml.YAMLError as e:
-            print(f"Could not parse config.yaml: {e}.\n"
-                  "Ensure that any Windows paths are either wrapped in single quotes or use double backslashes.")
-        except Exception as e:
-            print(f"Could not read config.yaml: {e}")
+    try:
+        user_cfg: Dict = _load_yaml_cached(_CFG_PATH) or {}
+        deep_update(defaults, user_cfg)
+    except FileNotFoundError:
+        pass
+    except yaml.YAMLError as e:
+        print(f"Could not parse config.yaml: {e}.\n"
+              "Ensure that any Windows paths are either wrapped in single quotes or use double backslashes.")
+    except Exception as e:
+        print(f"Could not read config.yaml: {e}")
     # Normalise log_dir to absolute path
-    defaults["log_dir"] = str((Path(__file__).parent / defaults["log_dir"]).resolve())
+    defaults["log_dir"] = _resolve_log_dir(defaults["log_dir"])
     return defaults
 
 
-def save_config(cfg: Dict) -> None:
-    """Persist the configuration to ``config.yaml`` next to this script."""
-    cfg_path = Path(__file__).with_name("config.yaml")
-    try:
-        with cfg_path.open("w", encoding="utf-8") as f:
-            yaml.safe_dump(cfg, f, sort_keys=False)
-    except Exception as e:
-        print(f"Failed to save config: {e}")
+@functools.lru_cache(maxsize=8)
+def _resolve_log_dir(log_dir: str) -> str:
+    """Return ``log_dir`` as an absolute path, relative to this script."""
+    return str((_HERE / log_dir).resolve())
+
+
+# Digest of the YAML text last written by ``save_config``; the lock is held
+# across the dump, the comparison and the write
+_last_saved_digest: Optional[bytes] = None
+_save_lock = threading.Lock()
+# Latest config waiting for the background writer, and that writer
+_pending_save: Optional[Dict] = None
+_save_thread: Optional[threading.Thread] = None
+_pending_lock = threading.Lock()
+
+
+def save_config(cfg: Dict) -> bool:
+    """Persist the configuration to ``config.yaml`` next to this script.
+
+    The file is left untouched when the serialised YAML matches what was
+    last written.
+
+    :return: ``False`` if nothing changed since the last save, else ``True``.
+    """
+    global _last_saved_digest
+    with _save_lock:
+        try:
+            text = yaml.dump(cfg, Dumper=_YDump, sort_keys=False)
+            digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+            if digest == _last_saved_digest:
+                return False
+            _CFG_PATH.write_text(text, encoding="utf-8")
+            _last_saved_digest = digest
+        except Exception as e:
+            print(f"Failed to save config: {e}")
+    return True
+
+
+def save_config_async(cfg: Dict) -> None:
+    """Save ``cfg`` on a background writer thread.
+
+    A single writer handles all saves, one at a time.  Configs queued while
+    it is busy replace each other, so only the newest one is written and an
+    older config can never overwrite it.  The writer is not a daemon thread,
+    so a pending save completes even if the window is closed right away.
+
+    :param cfg: Configuration to persist; the caller must not mutate it.
+    """
+    global _pending_save, _save_thread
+    with _pending_lock:
+        _pending_save = cfg
+        if _save_thread is None:
+            _save_thread = threading.Thread(target=_save_config_worker, name="ConfigWriter")
+            _save_thread.start()
+
+
+def _save_config_worker() -> None:
+    """Write queued configs until none is pending, then exit."""
+    global _pending_save, _save_thread
+    while True:
+        with _pending_lock:
+            cfg, _pending_save = _pending_save, None
+            if cfg is None:
+                _save_thread = None
+                return
+        save_config(cfg)
 
 
 ################################################################################
 # Troubleshooting Database Handling
 ################################################################################
 
-def load_troubleshooting_database() -> Dict[str, Dict[str, object]]:
+def load_troubleshooting_database() -> Mapping[str, Mapping[str, object]]:
     """Load a troubleshooting database from ``troubleshooting_database.yaml``.
 
     If the file exists next to this script, parse it and return the content.
@@ -226,16 +374,15 @@ def load_troubleshooting_database() -> Dict[str, Dict[str, object]]:
     Each entry must include at least ``title``, ``description``, ``causes``,
     ``resolutions``, ``links`` and ``category``.
     """
-    db_path = Path(__file__).with_name("troubleshooting_database.yaml")
-    if db_path.exists():
-        try:
-            with db_path.open("r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-            # Basic validation: ensure expected fields exist
-            if isinstance(data, dict):
-                return data
-        except Exception as e:
-            print(f"Failed to load troubleshooting database: {e}")
+    try:
+        data = _load_yaml_cached(_DB_PATH)
+        # Basic validation: ensure expected fields exist
+        if isinstance(data, dict):
+            return data
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"Failed to load troubleshooting database: {e}")
     # Fallback to built‑in database
     return BUILTIN_TROUBLESHOOTING_DATABASE
 
@@ -250,7 +397,7 @@ def load_troubleshooting_database() -> Dict[str, Dict[str, object]]:
 # diagnostics routines refer to when raising issues.  If you add a new issue,
 # update the heuristics in ``run_health_check`` or ``_analyse_logs`` to map
 # conditions to these IDs.
-BUILTIN_TROUBLESHOOTING_DATABASE: Dict[str, Dict[str, object]] = {
+_BUILTIN_TROUBLESHOOTING_DATABASE: Dict[str, Dict[str, object]] = {
     "wlan_service_not_running": {
         "title": "WLAN AutoConfig Service Not Running",
         "description": "The Windows service responsible for wireless configuration (WLAN AutoConfig) is not running. Without this service the Wi‑Fi adapter cannot connect to networks.",
@@ -458,6 +605,21 @@ BUILTIN_TROUBLESHOOTING_DATABASE: Dict[str, Dict[str, object]] = {
         "links": [],
         "category": "Roaming & channel plan",
     },
+    "channel_check_skipped": {
+        "title": "Channel Check Skipped",
+        "description": "No recent scan of nearby networks was available, so the channel plan and channel crowding checks did not run.",
+        "causes": [
+            "Nearby networks are only scanned while the Channels tab is open, and the requested scan did not arrive in time.",
+            "Monitoring is stopped, so no new scan could be taken.",
+            "The adapter is disabled or the network scan failed.",
+        ],
+        "resolutions": [
+            "Start monitoring if it is stopped.",
+            "Open the Channels tab for a few seconds, then run the health check again.",
+        ],
+        "links": [],
+        "category": "Roaming & channel plan",
+    },
     "frequent_disconnections": {
         "title": "Frequent Disconnections",
         "description": "Historical logs show that the device disconnects from Wi‑Fi often.",
@@ -560,41 +722,170 @@ BUILTIN_TROUBLESHOOTING_DATABASE: Dict[str, Dict[str, object]] = {
     },
 }
 
+# Read‑only view of the built‑in database.  Entries and their lists are frozen
+# so the same objects can be shared by the GUI and worker threads without
+# defensive copies; callers that need to modify an entry must copy it first.
+BUILTIN_TROUBLESHOOTING_DATABASE: Mapping[str, Mapping[str, object]] = types.MappingProxyType({
+    iid: types.MappingProxyType({
+        **entry,
+        "causes": tuple(entry["causes"]),
+        "resolutions": tuple(entry["resolutions"]),
+        "links": tuple(entry.get("links", [])),
+    })
+    for iid, entry in _BUILTIN_TROUBLESHOOTING_DATABASE.items()
+})
+
 ################################################################################
 # Utility Functions for Windows Network Commands
 ################################################################################
 
-def run_command(cmd: str, timeout: int = 8) -> str:
-    """Run a shell command and return its output as a string.
+# Suppress the console window that would otherwise flash up for every child
+# process on Windows.  The flag only exists there; elsewhere it must be 0.
+_CREATE_NO_WINDOW = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+# Windows console tools write their output in the ANSI code page.
+_CMD_ENCODING = "mbcs" if os.name == "nt" else None
+
 
-    :param cmd: Command line to execute.
+def run_command(argv: List[str], timeout: int = 8) -> str:
+    """Run a program directly (without a shell) and return its output.
+
+    :param argv: Program and arguments, e.g. ``["netsh", "wlan", "show", "interfaces"]``.
     :param timeout: Timeout in seconds.
     :returns: Output string (stdout) or empty string on error.
     """
     try:
-        return subprocess.run(cmd, shell=True, text=True,
+        return subprocess.run(argv, text=True, encoding=_CMD_ENCODING, errors="replace",
                               stdout=subprocess.PIPE,
                               stderr=subprocess.DEVNULL,
-                              timeout=timeout).stdout
+                              timeout=timeout,
+                              creationflags=_CREATE_NO_WINDOW).stdout
     except Exception:
         return ""
 
 
+class PowerShellHost:
+    """A long‑lived PowerShell session that runs scripts sent over stdin.
+
+    Starting ``powershell.exe`` costs a few hundred milliseconds, so scripts
+    are written to one background session and their output is read back up
+    to a unique end marker.  The session is started on first use and
+    restarted after it exits or stops answering.
+    """
+    def __init__(self) -> None:
+        self._proc: Optional[subprocess.Popen] = None
+        self._lines: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._lock = threading.Lock()
+
+    def _start(self) -> None:
+        self._proc = subprocess.Popen(
+            ["powershell", "-NoProfile", "-NoLogo", "-NonInteractive", "-Command", "-"],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            text=True, encoding=_CMD_ENCODING, errors="replace", bufsize=1,
+            creationflags=_CREATE_NO_WINDOW)
+        # stdout is drained by a helper thread so reads can time out
+        self._lines = queue.Queue()
+        threading.Thread(target=self._pump, args=(self._proc.stdout, self._lines), daemon=True).start()
+
+    @staticmethod
+    def _pump(stream, lines: "queue.Queue[Optional[str]]") -> None:
+        for line in stream:
+            lines.put(line)
+        lines.put(None)  # session ended
+
+    def run(self, script: str, timeout: float = 6.0) -> str:
+        """Run a single‑line ``script`` and return its output.
+
+        Returns an empty string if the session cannot be started or does not
+        finish within ``timeout`` seconds.
+        """
+        with self._lock:
+            sentinel = f"__END_{uuid.uuid4().hex}__"
+            try:
+                if self._proc is None or self._proc.poll() is not None:
+                    self._start()
+                self._proc.stdin.write(f"{script}\nWrite-Output '{sentinel}'\n")
+                self._proc.stdin.flush()
+            except Exception:
+                self._close_locked()
+                return ""
+            out = []
+            deadline = time.monotonic() + timeout
+            while True:
+                try:
+                    line = self._lines.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    self._close_locked()
+                    return ""
+                if line is None:
+                    self._close_locked()
+                    return ""
+                if line.strip() == sentinel:
+                    return "".join(out)
+                out.append(line)
+
+    def close(self) -> None:
+        """Terminate the session if it is running."""
+        with self._lock:
+            self._close_locked()
+
+    def _close_locked(self) -> None:
+        if self._proc is not None:
+            try:
+                self._proc.kill()
+            except Exception:
+                pass
+            self._proc = None
+
+
+_ps_host = PowerShellHost()
+atexit.register(_ps_host.close)
+
+
+# netsh invocations shared by the monitor and the diagnostics
+NETSH_INTERFACES_ARGV = ["netsh", "wlan", "show", "interfaces"]
+NETSH_SCAN_ARGV = ["netsh", "wlan", "show", "networks", "mode=bssid"]
+
+
+# Auto‑detected gateway and the ``time.monotonic()`` deadline until which it
+# may be reused.  Detection launches PowerShell, so it is only repeated when
+# the entry expires or the link changes (see ``invalidate_gateway_cache``).
+_GATEWAY_TTL = 300.0
+_gw_cache: Tuple[Optional[str], float] = (None, 0.0)
+
+
+def invalidate_gateway_cache() -> None:
+    """Forget the cached gateway so the next lookup detects it afresh."""
+    global _gw_cache
+    _gw_cache = (None, 0.0)
+
+
 def autodetect_gateway() -> Optional[str]:
     """Attempt to determine the default IPv4 gateway using PowerShell.
 
     Returns the IP address of the default gateway or ``None`` if detection
-    fails.  Uses the same logic as the original tool.
+    fails.  Uses the same logic as the original tool.  The result is cached
+    for ``_GATEWAY_TTL`` seconds.
     """
+    global _gw_cache
+    gw, expires = _gw_cache
+    now = time.monotonic()
+    if now < expires:
+        return gw
+    gw = _query_gateway()
+    _gw_cache = (gw, now + _GATEWAY_TTL)
+    return gw
+
+
+def _query_gateway() -> Optional[str]:
+    """Run the actual gateway detection for ``autodetect_gateway``."""
     # Use PowerShell Get-NetRoute to find lowest metric default route
-    cmd = (r'powershell -NoProfile -Command "(Get-NetRoute -DestinationPrefix '
-           r'0.0.0.0/0 | Sort-Object RouteMetric,InterfaceMetric | '
-           r'Select-Object -First 1).NextHop"')
-    gw = run_command(cmd, timeout=6).strip()
+    script = ("(Get-NetRoute -DestinationPrefix 0.0.0.0/0 | "
+              "Sort-Object RouteMetric,InterfaceMetric | Select-Object -First 1).NextHop")
+    gw = _ps_host.run(script, timeout=6).strip()
     if gw:
         return gw
     # Fallback: parse 'route print'
-    rp = run_command("route print 0.0.0.0", timeout=6)
+    rp = run_command(["route", "print", "0.0.0.0"], timeout=6)
     for line in rp.splitlines():
         if "0.0.0.0" in line and "." in line:
             parts = [p for p in line.split() if p.count(".") == 3]
@@ -603,6 +894,41 @@ def autodetect_gateway() -> Optional[str]:
     return None
 
 
+# A single pattern recognises every ``Key : value`` line we care about in the
+# output of ``netsh wlan show interfaces`` and ``netsh wlan show networks``.
+# Keys may carry an index (``SSID 1``, ``BSSID 2``) or a unit suffix
+# (``Receive rate (Mbps)``); anything else, e.g. ``SSID name`` or
+# ``Channel Utilization``, is deliberately left unmatched.
+_NETSH_LINE_RE = re.compile(
+    r"^(State|SSID|BSSID|Signal|Channel|Radio type|Receive rate|Transmit rate|Authentication)"
+    r"(?: \d+| \(Mbps\))?\s*:\s*(.*)$"
+)
+
+# netsh key -> field name in the dict returned by ``parse_netsh_interfaces``
+_IFACE_FIELDS: Dict[str, str] = {
+    "State": "state",
+    "SSID": "ssid",
+    "BSSID": "bssid",
+    "Signal": "signal_pct",
+    "Channel": "channel",
+    "Radio type": "radio_type",
+    "Receive rate": "receive_rate",
+    "Transmit rate": "transmit_rate",
+    "Authentication": "auth",
+}
+
+# Line prefixes worth handing to the regex; ``str.startswith`` with a tuple
+# rejects the other lines (Name, GUID, Cipher, ...) without a regex call
+_NETSH_KEYS: Tuple[str, ...] = tuple(_IFACE_FIELDS)
+
+# netsh key -> field name of a BSSID entry in ``parse_netsh_scan`` results
+_SCAN_FIELDS: Dict[str, str] = {
+    "Signal": "signal",
+    "Radio type": "radio",
+    "Channel": "channel",
+}
+
+
 def parse_netsh_interfaces(out: str) -> Dict[str, str]:
     """Parse the output of ``netsh wlan show interfaces`` into a dict."""
     info = {
@@ -616,55 +942,79 @@ def parse_netsh_interfaces(out: str) -> Dict[str, str]:
         "channel": "",
         "auth": "",
     }
+    match = _NETSH_LINE_RE.match
     for raw in out.splitlines():
         line = raw.strip()
-        if line.startswith("State"):
-            info["state"] = line.split(" ", 1)[-1].strip()
-        elif re.match(r"^SSID\s*:", line) and not line.lower().startswith("ssid name"):
-            info["ssid"] = line.split(":", 1)[1].strip()
-        elif line.startswith("BSSID"):
-            info["bssid"] = line.split(":", 1)[1].strip()
-        elif line.startswith("Signal"):
-            info["signal_pct"] = line.split(":", 1)[1].strip()
-        elif line.startswith("Channel"):
-            info["channel"] = line.split(":", 1)[1].strip()
-        elif line.startswith("Radio type"):
-            info["radio_type"] = line.split(":", 1)[1].strip()
-        elif line.startswith("Receive rate"):
-            info["receive_rate"] = line.split(":", 1)[1].strip()
-        elif line.startswith("Transmit rate"):
-            info["transmit_rate"] = line.split(":", 1)[1].strip()
-        elif line.startswith("Authentication"):
-            info["auth"] = line.split(":", 1)[1].strip()
+        if not line.startswith(_NETSH_KEYS):
+            continue
+        m = match(line)
+        if m:
+            info[_IFACE_FIELDS[m.group(1)]] = m.group(2)
     return info
 
 
+def _iter_netsh_fields(out: str) -> Iterator[Tuple[str, str]]:
+    """Yield ``(key, value)`` for the recognised lines of netsh output."""
+    match = _NETSH_LINE_RE.match
+    for raw in out.splitlines():
+        line = raw.strip()
+        if not line.startswith(_NETSH_KEYS):
+            continue
+        m = match(line)
+        if m:
+            yield m.group(1), m.group(2)
+
+
+def iter_netsh_bssids(out: str) -> Iterator[Dict[str, str]]:
+    """Yield one flat dict per BSSID in ``netsh wlan show networks`` output.
+
+    Each dict has ``ssid``, ``bssid``, ``signal``, ``radio`` and ``channel``.
+    Entries are produced while the output is walked, so a caller that only
+    needs part of the scan never has to build the full list.
+    """
+    ssid: Optional[str] = None
+    cur: Optional[Dict[str, str]] = None
+    for key, value in _iter_netsh_fields(out):
+        if key == "SSID":
+            if cur is not None:
+                yield cur
+                cur = None
+            ssid = value
+        elif key == "BSSID":
+            if ssid is None:
+                continue
+            if cur is not None:
+                yield cur
+            cur = {"ssid": ssid, "bssid": value, "signal": "", "radio": "", "channel": ""}
+        elif cur is not None:
+            field = _SCAN_FIELDS.get(key)
+            if field:
+                cur[field] = value
+    if cur is not None:
+        yield cur
+
+
 def parse_netsh_scan(out: str) -> List[Dict[str, object]]:
     """Parse the output of ``netsh wlan show networks mode=bssid``.
 
     Returns a list of dicts each representing an SSID with its BSSIDs.
     Each dict has fields: ``ssid`` and ``bssids`` (a list of dicts with
-    ``bssid``, ``signal``, ``radio`` and ``channel``).
+    ``bssid``, ``signal``, ``radio`` and ``channel``).  Every SSID block
+    gives one entry, including hidden networks and blocks without BSSIDs.
     """
     aps = []
     cur: Optional[Dict[str, object]] = None
-    for raw in out.splitlines():
-        s = raw.strip()
-        if s.startswith("SSID "):
-            if cur:
-                aps.append(cur)
-            cur = {"ssid": s.split(":", 1)[1].strip(), "bssids": []}
-        elif s.startswith("BSSID "):
+    for key, value in _iter_netsh_fields(out):
+        if key == "SSID":
+            cur = {"ssid": value, "bssids": []}
+            aps.append(cur)
+        elif key == "BSSID":
             if cur is not None:
-                cur["bssids"].append({"bssid": s.split(":", 1)[1].strip(), "signal": "", "radio": "", "channel": ""})
-        elif s.startswith("Signal") and cur and cur["bssids"]:
-            cur["bssids"][-1]["signal"] = s.split(":", 1)[1].strip()
-        elif s.startswith("Radio type") and cur and cur["bssids"]:
-            cur["bssids"][-1]["radio"] = s.split(":", 1)[1].strip()
-        elif s.startswith("Channel") and cur and cur["bssids"]:
-            cur["bssids"][-1]["channel"] = s.split(":", 1)[1].strip()
-    if cur:
-        aps.append(cur)
+                cur["bssids"].append({"bssid": value, "signal": "", "radio": "", "channel": ""})
+        elif cur and cur["bssids"]:
+            field = _SCAN_FIELDS.get(key)
+            if field:
+                cur["bssids"][-1][field] = value
     return aps
 
 
@@ -675,7 +1025,7 @@ def ping_host(host: str, count: int = 4) -> Tuple[Optional[float], Optional[int]
     """
     if not host:
         return None, None
-    out = run_command(f"ping -n {count} {host}", timeout=10)
+    out = run_command(["ping", "-n", str(count), host], timeout=10)
     if not out:
         return None, None
     loss = None
@@ -695,40 +1045,218 @@ def ping_host(host: str, count: int = 4) -> Tuple[Optional[float], Optional[int]
     return avg, loss
 
 
+# Cleared the first time ICMP sockets turn out to be unusable (e.g. missing
+# privileges) so later samples go straight to the ``ping`` command.
+_native_ping_ok = True
+
+
+def ping_host_native(host: str, count: int = 4, interval: float = 0.2,
+                     timeout: float = 1.0) -> Tuple[Optional[float], Optional[int]]:
+    """Ping a host in‑process and return (average_latency_ms, packet_loss_percent).
+
+    Sends the echo requests through ``icmplib`` instead of launching and
+    parsing the Windows ``ping`` command.  Falls back to ``ping_host`` when
+    ``icmplib`` is not installed or ICMP sockets cannot be opened.  Returns
+    ``(None, None)`` on error.
+    """
+    global _native_ping_ok
+    if not host:
+        return None, None
+    if icmplib is None or not _native_ping_ok:
+        return ping_host(host, count)
+    try:
+        result = icmplib.ping(host, count=count, interval=interval, timeout=timeout, privileged=False)
+    except icmplib.ICMPSocketError:
+        _native_ping_ok = False
+        return ping_host(host, count)
+    except Exception:
+        return None, None
+    loss = round(result.packet_loss * 100)
+    avg = round(result.avg_rtt, 1) if result.packets_received else None
+    return avg, loss
+
+
+def _build_band_table() -> Tuple[str, ...]:
+    """Return a tuple mapping channel numbers 0–255 to band labels."""
+    table = ["?"] * 256
+    for ch in range(1, 15):
+        table[ch] = "2.4"
+    for ch in range(32, 178):
+        table[ch] = "5"
+    for ch in range(180, 256):
+        table[ch] = "6"
+    return tuple(table)
+
+
+_BAND_TABLE = _build_band_table()
+
+
 def band_for_channel(ch_str: str) -> str:
     """Return a band label (2.4, 5, 6, ?) based on channel number string."""
     try:
         ch = int(ch_str)
     except Exception:
         return "?"
-    if ch <= 14:
-        return "2.4"
-    if 32 <= ch <= 177:
-        return "5"
-    if ch >= 180:
-        return "6"
-    return "?"
+    return _BAND_TABLE[ch] if 0 <= ch < 256 else "?"
+
+
+def channel_counts(scan_flat: List[Dict[str, object]]) -> Tuple[Counter, Counter]:
+    """Count BSSIDs per channel in flattened scan entries.
+
+    :return: ``(ch24, ch5)`` counters for the 2.4 GHz and 5 GHz bands.
+    """
+    # A band label is only assigned to channels that parsed as integers
+    ch24 = Counter(int(x["channel"]) for x in scan_flat if x.get("band") == "2.4")
+    ch5 = Counter(int(x["channel"]) for x in scan_flat if x.get("band") == "5")
+    return ch24, ch5
+
+
+def crowded_channels_24(ch24: Mapping[int, int], threshold: int = 8) -> List[Tuple[int, int]]:
+    """Return ``(channel, count)`` for occupied 2.4 GHz channels whose ±2
+    channel neighbourhood holds at least ``threshold`` BSSIDs."""
+    counts = np.zeros(15, dtype=np.int32)  # index = channel number (1–14)
+    counts[list(ch24.keys())] = list(ch24.values())
+    # Sliding ±2 sum over the whole band in one pass
+    crowd = np.convolve(counts, np.ones(5, dtype=np.int32), mode="same")
+    return [(ch, int(crowd[ch])) for ch in sorted(ch24) if crowd[ch] >= threshold]
+
+
+# Ranking key for flattened scan entries: the integer signal % that
+# ``MonitorThread._flatten_scan`` stores once per entry (-1 if unknown)
+_signal_key = operator.itemgetter("_sig_int")
+
+
+class RingBuffer:
+    """Fixed‑size numpy ring buffer for chart series.
+
+    Samples live in one contiguous numpy array instead of a deque of boxed
+    Python objects, and ``view`` hands matplotlib an array it can use as is.
+
+    :param maxlen: Number of samples kept.
+    :param dtype: Element type; float32 suits the chart series.
+    :param fill: Value of unused slots (NaN, or NaT for timestamps).
+    """
+    def __init__(self, maxlen: int, dtype: object = np.float32, fill: object = np.nan):
+        self.maxlen = maxlen
+        self._buf = np.full(maxlen, fill, dtype=dtype)
+        self._head = 0    # slot the next sample goes into
+        self._filled = 0
+
+    def append(self, v: float) -> None:
+        self._buf[self._head] = v
+        self._head = (self._head + 1) % self.maxlen
+        if self._filled < self.maxlen:
+            self._filled += 1
+
+    def __len__(self) -> int:
+        return self._filled
+
+    def __iter__(self):
+        return iter(self.view())
+
+    def view(self) -> np.ndarray:
+        """Return the samples oldest first, as a copy safe to keep."""
+        if self._filled < self.maxlen:
+            return self._buf[:self._filled].copy()
+        return np.concatenate((self._buf[self._head:], self._buf[:self._head]))
+
+
+class SlidingStats:
+    """Mean and maximum over the last ``maxlen`` samples in O(1) per sample.
+
+    A running sum gives the mean, and a monotonic deque of ``(index, value)``
+    pairs gives the window maximum.  Each is only maintained when asked for.
+    NaN (a missed sample) occupies a slot in the window but is excluded from
+    the statistics.
+
+    :param maxlen: Number of samples in the window.
+    :param mean: Track the window mean.
+    :param peak: Track the window maximum.
+    """
+    def __init__(self, maxlen: int, mean: bool = True, peak: bool = True):
+        self.maxlen = maxlen
+        self.track_mean = mean
+        self.track_peak = peak
+        self._vals: deque = deque()
+        self._n = 0          # valid (non‑NaN) values in the window
+        self._sum = 0.0
+        self._idx = 0        # index of the next sample
+        self._maxs: deque = deque()  # values decreasing from the left
+
+    def push(self, v: float) -> None:
+        """Add a sample, evicting the oldest once the window is full."""
+        if len(self._vals) == self.maxlen:
+            old = self._vals.popleft()
+            if not math.isnan(old):
+                self._n -= 1
+                if self.track_mean:
+                    self._sum -= old
+        self._vals.append(v)
+        valid = not math.isnan(v)
+        if valid:
+            self._n += 1
+            if self.track_mean:
+                self._sum += v
+        if self.track_peak:
+            i = self._idx
+            self._idx += 1
+            maxs = self._maxs
+            first = i - len(self._vals) + 1  # oldest index still in the window
+            while maxs and maxs[0][0] < first:
+                maxs.popleft()
+            if valid:
+                while maxs and maxs[-1][1] <= v:
+                    maxs.pop()
+                maxs.append((i, v))
+
+    def mean(self) -> Optional[float]:
+        return self._sum / self._n if self.track_mean and self._n else None
+
+    def max(self) -> Optional[float]:
+        return self._maxs[0][1] if self._maxs else None
 
 
 ################################################################################
 # Speed Test Implementation
 ################################################################################
 
-def http_speed_test(url: str) -> Optional[float]:
+# Read size for HTTP speed tests; large reads keep per‑call overhead low
+_SPEED_TEST_CHUNK = 256 * 1024
+
+
+def http_speed_test(url: str, max_seconds: Optional[float] = None,
+                    max_bytes: Optional[int] = None) -> Optional[float]:
     """Download a file from ``url`` and return the download speed in Mbps.
 
     This function performs a simple HTTP GET request to download a file.  It
     measures the elapsed time and the total number of bytes received.  The
     returned speed is in megabits per second.  Returns ``None`` on error.
+
+    The body is read into one reused buffer and discarded, so memory use
+    does not grow with the file size.  Timing starts once the response
+    headers arrive, which leaves DNS and connection setup out of the figure.
+
+    :param url: File to download.
+    :param max_seconds: Stop reading after this long and rate what arrived.
+    :param max_bytes: Stop reading after this many bytes.
     """
     try:
-        start = time.perf_counter()
+        buf = bytearray(_SPEED_TEST_CHUNK)
+        size_bytes = 0
         with urllib.request.urlopen(url, timeout=15) as response:
-            data = response.read()
-        elapsed = time.perf_counter() - start
+            start = time.perf_counter()
+            while True:
+                n = response.readinto(buf)
+                if not n:
+                    break
+                size_bytes += n
+                if max_bytes is not None and size_bytes >= max_bytes:
+                    break
+                if max_seconds is not None and time.perf_counter() - start >= max_seconds:
+                    break
+            elapsed = time.perf_counter() - start
         if elapsed <= 0:
             return None
-        size_bytes = len(data)
         speed_mbps = (size_bytes * 8) / (elapsed * 1_000_000)
         return speed_mbps
     except Exception:
@@ -761,44 +1289,427 @@ def iperf3_speed_test(server: str, port: int, duration: int = 10) -> Optional[fl
 # Logging and Log Rotation
 ################################################################################
 
-def rotate_log(path: Path, retention_days: int, max_mb: float) -> None:
+# Characters that force a CSV field to be quoted
+_CSV_SPECIAL_RE = re.compile(r'[",\r\n]')
+
+
+def csv_field(value: object) -> str:
+    """Format one CSV field the way ``csv.writer`` does (minimal quoting)."""
+    s = "" if value is None else str(value)
+    if _CSV_SPECIAL_RE.search(s):
+        return '"' + s.replace('"', '""') + '"'
+    return s
+
+
+def csv_line(row: List[object]) -> str:
+    """Format ``row`` as one CSV record with ``csv.writer``'s line ending."""
+    return ",".join(map(csv_field, row)) + "\r\n"
+
+
+class LogWriter(threading.Thread):
+    """Append log records to files from a dedicated background thread.
+
+    Producers queue lines (or CSV rows) with :meth:`write` and
+    :meth:`write_row` and return immediately.  The writer keeps one handle
+    open per file and writes queued records in batches, once ``flush_every``
+    records are pending or ``flush_sec`` seconds have passed, whichever
+    comes first, so file I/O never runs on the sampling thread.  Files are
+    opened in binary mode and each batch is encoded to UTF‑8 in one go.
+    """
+    _STOP = object()
+
+    def __init__(self, flush_every: int = 32, flush_sec: float = 1.0):
+        super().__init__(daemon=True, name="LogWriter")
+        self.flush_every = flush_every
+        self.flush_sec = flush_sec
+        self._queue: "queue.Queue[object]" = queue.Queue()
+        self._files: Dict[Path, io.BufferedWriter] = {}
+        atexit.register(self.close)
+
+    def write(self, path: Path, line: str) -> None:
+        """Queue ``line`` (including its line terminator) for ``path``."""
+        self._queue.put((path, line))
+
+    def write_row(self, path: Path, row: List[object]) -> None:
+        """Queue ``row`` to be appended to ``path`` as a CSV record."""
+        self._queue.put((path, csv_line(row)))
+
+    def flush(self, timeout: float = 2.0) -> None:
+        """Block until records queued so far are on disk (or ``timeout``)."""
+        if not self.is_alive():
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait(timeout)
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Write out pending records, close the files and stop the thread."""
+        atexit.unregister(self.close)
+        if self.is_alive():
+            self._queue.put(self._STOP)
+            self.join(timeout)
+
+    def run(self) -> None:
+        pending: Dict[Path, List[str]] = {}
+        count = 0
+        deadline = time.monotonic() + self.flush_sec
+        while True:
+            try:
+                item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                item = None
+            if item is self._STOP:
+                self._write_batch(pending)
+                for f in self._files.values():
+                    f.close()
+                self._files.clear()
+                return
+            if isinstance(item, threading.Event):
+                self._write_batch(pending)
+                count = 0
+                deadline = time.monotonic() + self.flush_sec
+                item.set()
+                continue
+            if item is not None:
+                path, line = item
+                pending.setdefault(path, []).append(line)
+                count += 1
+            if count >= self.flush_every or time.monotonic() >= deadline:
+                self._write_batch(pending)
+                count = 0
+                deadline = time.monotonic() + self.flush_sec
+
+    def _write_batch(self, pending: Dict[Path, List[str]]) -> None:
+        for path, lines in pending.items():
+            if not lines:
+                continue
+            try:
+                f = self._files.get(path)
+                if f is None:
+                    f = self._files[path] = path.open("ab", buffering=1 << 16)
+                f.write("".join(lines).encode("utf-8"))
+                f.flush()
+            except Exception as e:
+                print(f"Failed to write {path.name}: {e}")
+            lines.clear()
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_log_ts(ts: str) -> datetime:
+    """Parse a logged ISO‑8601 timestamp, accepting ``Z`` for UTC.
+
+    Cached because the same timestamps are parsed repeatedly, e.g. by the
+    byte‑offset bisection on every Logs tab filter change.
+    """
+    if ts.endswith("Z"):
+        ts = ts[:-1] + "+00:00"
+    return datetime.fromisoformat(ts)
+
+
+class RoamHistory:
+    """Timestamps of the roaming events log, read incrementally.
+
+    Only bytes appended since the previous call are read and parsed, so
+    counting recent roams costs O(new events) rather than a pass over the
+    whole file.  Rows are appended in time order, which keeps the cached
+    epoch timestamps sorted for ``bisect``.  Safe to share between threads.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._path: Optional[Path] = None
+        self._offset = 0
+        self._times: List[float] = []  # POSIX timestamps
+        self._last_ts = ""
+
+    def _refresh(self, path: Path) -> None:
+        try:
+            size = path.stat().st_size
+        except OSError:
+            size = 0
+        if path != self._path or size < self._offset:
+            # Different or truncated/rotated file: start over
+            self._path, self._offset, self._times, self._last_ts = path, 0, [], ""
+        if size <= self._offset:
+            return
+        with path.open("rb") as f:
+            f.seek(self._offset)
+            chunk = f.read(size - self._offset)
+        # Leave a partially written last line for the next call
+        end = chunk.rfind(b"\n") + 1
+        self._offset += end
+        for line in chunk[:end].splitlines():
+            ts_str = line.split(b",", 1)[0].decode("ascii", "ignore")
+            try:
+                dt = parse_log_ts(ts_str)
+            except ValueError:
+                continue  # header or malformed row
+            self._times.append(dt.timestamp())
+            self._last_ts = ts_str
+
+    def count_since(self, path: Path, cutoff: datetime) -> int:
+        """Number of roams logged at or after ``cutoff``."""
+        with self._lock:
+            self._refresh(path)
+            return len(self._times) - bisect.bisect_left(self._times, cutoff.timestamp())
+
+    def total(self, path: Path) -> int:
+        """Number of roams in the log."""
+        with self._lock:
+            self._refresh(path)
+            return len(self._times)
+
+    def last(self, path: Path) -> str:
+        """Timestamp text of the most recent roam, or ``""``."""
+        with self._lock:
+            self._refresh(path)
+            return self._last_ts
+
+
+def rotate_log(path: Path, retention_days: int, max_mb: float, live: Iterable[Path] = ()) -> None:
     """Rotate and trim log files based on age and total folder size.
 
+    The directory is read once with ``os.scandir``, whose entries carry
+    cached metadata, instead of globbing and stat‑ing every file repeatedly.
+
     :param path: The directory containing log files.
     :param retention_days: Days to keep old logs.
     :param max_mb: Maximum folder size in megabytes.
+    :param live: Files still being written; they count towards the size
+        but are never deleted.
     """
-    if not path.exists():
-        return
-    # Remove files older than retention_days
+    live_paths = {os.path.normcase(os.path.abspath(p)) for p in live}
     cutoff = datetime.now(timezone.utc) - timedelta(days=retention_days)
-    for f in path.glob("*.zip"):
-        try:
-            stamp = f.stem.split("_")[-1]
-            dt = datetime.strptime(stamp, "%Y%m%d").replace(tzinfo=timezone.utc)
-            if dt < cutoff.replace(hour=0, minute=0, second=0, microsecond=0):
-                f.unlink(missing_ok=True)
-        except Exception:
-            pass
+    cutoff = cutoff.replace(hour=0, minute=0, second=0, microsecond=0)
+    files: List[Tuple[float, int, str]] = []  # (mtime, size, path) of kept files
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if not entry.is_file():
+                    continue
+                # Remove archives older than retention_days
+                if entry.name.lower().endswith(".zip"):
+                    try:
+                        stamp = entry.name[:-4].split("_")[-1]
+                        dt = datetime.strptime(stamp, "%Y%m%d").replace(tzinfo=timezone.utc)
+                        if dt < cutoff:
+                            os.remove(entry.path)
+                            continue
+                    except Exception:
+                        pass
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                files.append((st.st_mtime, st.st_size, entry.path))
+    except OSError:
+        return
     # If folder exceeds max_mb, delete oldest files
-    def folder_size_mb(p: Path) -> float:
-        total = 0
-        for file in p.rglob("*"):
-            if file.is_file():
-                total += file.stat().st_size
-        return total / (1024 * 1024)
-    while folder_size_mb(path) > max_mb:
-        files = sorted([p for p in path.glob("*") if p.is_file()], key=lambda p: p.stat().st_mtime)
-        if files:
-            files[0].unlink(missing_ok=True)
-        else:
+    limit = max_mb * 1024 * 1024
+    total = sum(size for _, size, _ in files)
+    if total <= limit:
+        return
+    files.sort()
+    for _, size, file_path in files:
+        if total <= limit:
             break
+        if os.path.normcase(os.path.abspath(file_path)) in live_paths:
+            continue
+        try:
+            os.remove(file_path)
+        except OSError:
+            continue  # e.g. open elsewhere; its size still counts
+        total -= size
+
+
+def _iter_lines_reversed(mm: mmap.mmap, lo: int, hi: int) -> Iterator[bytes]:
+    """Yield the lines of ``mm[lo:hi]`` from last to first, without newlines."""
+    end = hi
+    if end > lo and mm[end - 1:end] == b"\n":
+        end -= 1
+    while end > lo:
+        nl = mm.rfind(b"\n", lo, end)
+        yield mm[nl + 1 if nl >= 0 else lo:end].rstrip(b"\r")
+        end = max(nl, lo)
+
+
+def _line_ts(mm: mmap.mmap, pos: int) -> Optional[datetime]:
+    """Parse the leading timestamp field of the log line starting at ``pos``."""
+    comma = mm.find(b",", pos, pos + 64)
+    if comma < 0:
+        return None
+    try:
+        return parse_log_ts(mm[pos:comma].decode("ascii"))
+    except Exception:
+        return None
+
+
+def _bisect_log(mm: mmap.mmap, lo: int, hi: int, target: datetime, right: bool = False) -> int:
+    """Return the offset of the first line in ``[lo, hi)`` stamped at or after
+    ``target`` (strictly after when ``right`` is true).
+
+    Rows are appended in time order, so the search probes byte offsets and
+    decodes only the timestamps of the lines it lands on.  ``lo`` and ``hi``
+    must be line starts.
+    """
+    while lo < hi:
+        mid = (lo + hi) // 2
+        ls = mm.rfind(b"\n", lo, mid) + 1 or lo
+        nl = mm.find(b"\n", ls, hi)
+        le = hi if nl < 0 else nl + 1
+        ts = _line_ts(mm, ls)
+        if ts is None or (ts <= target if right else ts < target):
+            lo = le
+        else:
+            hi = ls
+    return lo
+
+
+def tail_csv_log(path: Path, limit: int = 500, start: Optional[datetime] = None,
+                 end: Optional[datetime] = None,
+                 search: Optional[str] = None) -> Tuple[List[str], List[List[str]]]:
+    """Return the header and the last ``limit`` matching rows of a CSV log.
+
+    The file is memory‑mapped so only the pages that are touched get read.
+    A date range is located by binary search over byte offsets, then rows
+    are decoded backwards from its end until ``limit`` rows contain
+    ``search``.
+
+    :param path: CSV log whose first column is an ISO timestamp.
+    :param limit: Maximum number of rows to return.
+    :param start: Earliest timestamp to include (naive values are local time).
+    :param end: Latest timestamp to include (naive values are local time).
+    :param search: Optional lowercase text that some cell must contain.
+    :return: ``(header, rows)`` with rows in file order.
+    """
+    try:
+        with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            nl = mm.find(b"\n")
+            if nl < 0:
+                return [], []
+            header = next(csv.reader([mm[:nl].decode("utf-8", "ignore").rstrip("\r")]), [])
+            lo, hi = nl + 1, len(mm)
+            # Logged timestamps are UTC‑aware; treat naive bounds as local time
+            if start is not None:
+                lo = _bisect_log(mm, lo, hi, start if start.tzinfo else start.astimezone())
+            if end is not None:
+                hi = _bisect_log(mm, lo, hi, end if end.tzinfo else end.astimezone(), right=True)
+            # Every cell is a substring of its raw line unless the search
+            # text contains a quote (doubled in the file), so the raw line
+            # can reject rows before they are parsed
+            prefilter = bool(search) and '"' not in search
+            rows: List[List[str]] = []
+            for raw in _iter_lines_reversed(mm, lo, hi):
+                if len(rows) >= limit:
+                    break
+                text = raw.decode("utf-8", "ignore")
+                if prefilter and search not in text.lower():
+                    continue
+                row = next(csv.reader([text]), None)
+                if not row:
+                    continue
+                # One lowercase pass per row; the separator keeps matches
+                # from spanning two cells
+                if search and search not in "\x1f".join(row).lower():
+                    continue
+                rows.append(row)
+            rows.reverse()
+            return header, rows
+    except (OSError, ValueError):
+        # Missing file, or an empty one (which cannot be mapped)
+        return [], []
+
+
+def csv_column(rows: List[List[str]], idx: int) -> np.ndarray:
+    """Return column ``idx`` of parsed CSV rows as a string array ("" for short rows)."""
+    try:
+        # Fast path: one C‑level itemgetter call per row, no bounds checks
+        cells = list(map(operator.itemgetter(idx), rows))
+    except IndexError:
+        cells = [row[idx] if idx < len(row) else "" for row in rows]
+    return np.array(cells, dtype=str)
+
+
+def csv_column_floats(rows: List[List[str]], idx: int) -> np.ndarray:
+    """Return the numeric cells of column ``idx`` as float64.
+
+    ``%`` signs and blanks are stripped, and blank or malformed cells are
+    skipped.  The conversion runs on the whole column at once; only a
+    column with a malformed cell falls back to per‑cell parsing.
+    """
+    cells = np.char.strip(csv_column(rows, idx), "% ")
+    cells = cells[cells != ""]
+    try:
+        return cells.astype(np.float64)
+    except ValueError:
+        values = []
+        for cell in cells:
+            try:
+                values.append(float(cell))
+            except ValueError:
+                pass
+        return np.array(values, dtype=np.float64)
+
+
+def tail_lines(path: Path, limit: int) -> List[str]:
+    """Return the last ``limit`` lines of a text file via a memory map."""
+    try:
+        with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            lines = [raw.decode("utf-8", "ignore")
+                     for raw in itertools.islice(_iter_lines_reversed(mm, 0, len(mm)), limit)]
+    except (OSError, ValueError):
+        return []
+    lines.reverse()
+    return lines
 
 
 ################################################################################
 # Background Worker Threads
 ################################################################################
 
+class Notifier(threading.Thread):
+    """Deliver threshold notifications from a dedicated thread.
+
+    Notification back ends (plyer toasts in particular) can block, so the
+    monitor only queues ``(key, message)`` pairs.  A message is dropped if
+    one with the same key went out less than ``min_interval`` seconds ago.
+    """
+    def __init__(self, channels: List[str], min_interval: float = 30.0):
+        super().__init__(daemon=True, name="Notifier")
+        self.channels = channels
+        self.min_interval = min_interval
+        self._queue: "queue.Queue[Optional[Tuple[str, str]]]" = queue.Queue()
+        self._last_sent: Dict[str, float] = {}
+
+    def notify(self, key: str, msg: str) -> None:
+        """Queue ``msg``; ``key`` identifies the condition for rate limiting."""
+        self._queue.put_nowait((key, msg))
+
+    def close(self) -> None:
+        """Stop after the queued notifications (does not wait)."""
+        self._queue.put_nowait(None)
+
+    def run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            key, msg = item
+            now = time.monotonic()
+            last = self._last_sent.get(key)
+            if last is not None and now - last < self.min_interval:
+                continue
+            self._last_sent[key] = now
+            # Use plyer notification if available and configured
+            if "plyer" in self.channels and notification is not None:
+                try:
+                    notification.notify(title="Wi‑Fi Diagnostics", message=msg)
+                except Exception:
+                    pass
+            if "popup" in self.channels:
+                # Here we simply print to console; GUI will handle notifications separately
+                print(f"NOTIFICATION: {msg}")
+
+
 class MonitorThread(threading.Thread):
     """Background thread for monitoring Wi‑Fi statistics and logging.
 
@@ -810,7 +1721,22 @@ class MonitorThread(threading.Thread):
     Results are delivered to a callback (usually the GUI) as a dictionary
     containing summary statistics.
     """
-    def __init__(self, config: Dict, db: Dict[str, Dict[str, object]], summary_callback: Callable[[Dict], None]):
+    CSV_HEADER = (
+        "ts", "state", "ssid", "bssid", "signal_pct", "channel", "radio_type",
+        "ping_gateway_avg", "ping_gateway_loss", "ping_remote_avg", "ping_remote_loss",
+        "download_mbps",
+    )
+    ROAM_HEADER = ("ts", "ssid", "old_bssid", "new_bssid", "old_signal", "new_signal")
+    # Sample record: the text fields are escaped with csv_field, the
+    # numeric ones are formatted as is
+    CSV_LINE = ",".join(["{}"] * len(CSV_HEADER)) + "\r\n"
+    # Consecutive in‑range samples before a tripped threshold may notify again
+    NOTIFY_REARM_SAMPLES = 3
+    # Seconds between refreshes of the service/log health data
+    HEALTH_REFRESH_SEC = 60
+
+    def __init__(self, config: Dict, db: Mapping[str, Mapping[str, object]], summary_callback: Callable[[Dict], None],
+                 roam_history: Optional[RoamHistory] = None):
         super().__init__(daemon=True)
         self.cfg = config
         self.db = db
@@ -825,22 +1751,68 @@ class MonitorThread(threading.Thread):
         # Initialising logs
         if not self.csv_path.exists():
             with self.csv_path.open("w", newline="", encoding="utf-8") as f:
-                writer = csv.writer(f)
-                writer.writerow([
-                    "ts", "state", "ssid", "bssid", "signal_pct", "channel", "radio_type",
-                    "ping_gateway_avg", "ping_gateway_loss", "ping_remote_avg", "ping_remote_loss",
-                    "download_mbps"
-                ])
+                csv.writer(f).writerow(self.CSV_HEADER)
         if not self.roam_path.exists():
             with self.roam_path.open("w", newline="", encoding="utf-8") as f:
-                csv.writer(f).writerow(["ts", "ssid", "old_bssid", "new_bssid", "old_signal", "new_signal"])
+                csv.writer(f).writerow(self.ROAM_HEADER)
+        # Compact JSON encoder built once and reused for every JSONL record
+        self._encode = json.JSONEncoder(separators=(",", ":")).encode
+        # Set by the GUI while the Channels tab, the only consumer of the
+        # nearby‑network scan, is visible
+        self.scan_networks_enabled = threading.Event()
+        # One‑shot request for a scan in the next sample
+        self.scan_requested = threading.Event()
+        # Last raw netsh outputs and their parses; on a stable link they
+        # repeat byte for byte and the parse is reused
+        self._last_intf: Optional[Tuple[str, Dict[str, str]]] = None
+        self._last_scan: Optional[Tuple[str, List[Dict[str, object]], List[Dict[str, object]]]] = None
+        # Workers for the independent netsh queries and pings of each sample
+        self._pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="sample")
+        # Threshold notifications are delivered off the sampling thread
+        notif_cfg = self.cfg.get("notifications", {})
+        self._notifier = Notifier(notif_cfg.get("channels", []), float(notif_cfg.get("min_interval_sec", 30)))
+        self._notifier.start()
+        self.reload_thresholds()
+        # Tripped threshold keys -> in‑range samples seen since
+        self._notif_tripped: Dict[str, int] = {}
+        # Log records are written in batches by a background thread
+        self._log_writer = LogWriter()
+        self._log_writer.start()
         # Rolling buffers for charts
         max_samples = max(60, int(600 / max(1, self.cfg["scan_interval"])))
-        self.buf_signal = deque(maxlen=max_samples)
-        self.buf_ping_gw = deque(maxlen=max_samples)
-        self.buf_ping_rem = deque(maxlen=max_samples)
-        self.buf_throughput = deque(maxlen=max_samples)
-        self.buf_ts = deque(maxlen=max_samples)
+        self.max_samples = max_samples
+        self.buf_signal = RingBuffer(max_samples)
+        self.buf_ping_gw = RingBuffer(max_samples)
+        self.buf_ping_rem = RingBuffer(max_samples)
+        self.buf_throughput = RingBuffer(max_samples)
+        self.buf_ts = RingBuffer(max_samples, "datetime64[us]", np.datetime64("NaT"))
+        # Guards the buffers; readers copy them via snapshot_buffers()
+        self._buf_lock = threading.Lock()
+        # Number of samples appended so far; lets readers spot stale data
+        self.sample_seq = 0
+        # Windowed statistics over the same samples, updated incrementally;
+        # only those read elsewhere are kept: the report's averages and the
+        # dashboard's axis limits
+        self.stats = {
+            "signal": SlidingStats(max_samples, peak=False),
+            "ping_gw": SlidingStats(max_samples),
+            "ping_rem": SlidingStats(max_samples),
+            "throughput": SlidingStats(max_samples, mean=False),
+        }
+        # UTC date of the last log rotation
+        self._last_rotate_date: Optional[date] = None
+        # Roam log reader, shared with the GUI when it passes one in
+        self.roam_history = roam_history if roam_history is not None else RoamHistory()
+        # Service state, roam rate and log analysis for the health check,
+        # refreshed every HEALTH_REFRESH_SEC on a worker of its own, so a
+        # slow refresh never holds up the sampling pool
+        self._health_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="health")
+        self._health_lock = threading.Lock()
+        self.latest_health: Dict[str, object] = {}
+        self._health_due = 0.0
+        self._health_future: Optional[Future] = None
+        # (log stat + thresholds key, issues) of the last log tail analysis
+        self._log_issues_cache: Optional[Tuple[Tuple, Tuple[Tuple[str, str], ...]]] = None
         # State for roaming detection
         self.prev_bssid: Optional[str] = None
         self.prev_signal: Optional[str] = None
@@ -856,37 +1828,70 @@ class MonitorThread(threading.Thread):
 
     def run(self) -> None:
         """Main loop: sample Wi‑Fi statistics until stopped."""
-        # Determine gateway to ping
-        gw = self.cfg["ping_targets"].get("gateway") or autodetect_gateway()
+        # Gateway to ping; when not configured it is auto‑detected below
+        cfg_gw = self.cfg["ping_targets"].get("gateway")
+        prev_link: Optional[Tuple[str, str]] = None
         remote = self.cfg["ping_targets"].get("remote")
         scan_interval = self.cfg["scan_interval"]
         ping_count = self.cfg["ping_count"]
         retention_days = self.cfg.get("log_retention_days", 14)
         max_mb = float(self.cfg.get("max_log_mb", 512))
+        scan_always = bool(self.cfg.get("scan_networks_when_hidden", False))
+        verbose_jsonl = bool(self.cfg.get("verbose_jsonl", False))
+        # Scan list last written to JSONL (the cached parse is reused while
+        # the raw netsh output is unchanged, so identity means "same scan")
+        logged_scan: Optional[List[Dict[str, object]]] = None
         while not self.stop_event.is_set():
-            start_ts = datetime.now(timezone.utc)
-            # Sample netsh interfaces
-            intf_out = run_command("netsh wlan show interfaces")
-            intf_info = parse_netsh_interfaces(intf_out)
-            # Sample nearby networks (optional; used by Channels tab)
-            scan_out = run_command("netsh wlan show networks mode=bssid")
-            scan_list = parse_netsh_scan(scan_out)
-            # Ping targets
-            ping_gw_avg, ping_gw_loss = ping_host(gw, ping_count) if gw else (None, None)
-            ping_rem_avg, ping_rem_loss = ping_host(remote, ping_count) if remote else (None, None)
+            # One clock read per sample; the ISO text is shared by every log record
+            now_ns = time.time_ns()
+            start_ts = datetime.fromtimestamp(now_ns / 1e9, timezone.utc)
+            ts_iso = start_ts.isoformat()
+            # The netsh queries and pings are independent, so run them side
+            # by side; the gateway ping waits only for the interface query
+            # that decides which gateway to use.
+            pool = self._pool
+            fut_intf = pool.submit(run_command, NETSH_INTERFACES_ARGV)
+            # Nearby networks (optional; used by Channels tab)
+            fut_scan = None
+            if scan_always or self.scan_networks_enabled.is_set() or self.scan_requested.is_set():
+                self.scan_requested.clear()
+                fut_scan = pool.submit(run_command, NETSH_SCAN_ARGV)
+            fut_rem = pool.submit(ping_host_native, remote, ping_count)
+            intf_out = fut_intf.result()
+            if self._last_intf is None or self._last_intf[0] != intf_out:
+                self._last_intf = (intf_out, parse_netsh_interfaces(intf_out))
+            intf_info = self._last_intf[1]
+            # Fields used below, looked up once
+            state = intf_info.get("state")
+            ssid = intf_info.get("ssid")
+            cur_bssid = intf_info.get("bssid")
+            cur_signal = intf_info.get("signal_pct")
+            # Re‑detect the gateway whenever the association changes
+            link = (state, cur_bssid)
+            if link != prev_link:
+                invalidate_gateway_cache()
+                prev_link = link
+            gw = cfg_gw or autodetect_gateway()
+            fut_gw = pool.submit(ping_host_native, gw, ping_count)
+            scan_list = scan_flat = None
+            if fut_scan:
+                scan_out = fut_scan.result()
+                if self._last_scan is None or self._last_scan[0] != scan_out:
+                    parsed = parse_netsh_scan(scan_out)
+                    self._last_scan = (scan_out, parsed, self._flatten_scan(parsed))
+                scan_list, scan_flat = self._last_scan[1], self._last_scan[2]
+            ping_gw_avg, ping_gw_loss = fut_gw.result()
+            ping_rem_avg, ping_rem_loss = fut_rem.result()
             # Throughput (if last speed test result is available)
             throughput = self.last_speed_test
             # Determine roaming events
-            cur_bssid = intf_info.get("bssid")
-            cur_signal = intf_info.get("signal_pct")
-            if intf_info.get("ssid") and cur_bssid:
+            if ssid and cur_bssid:
                 if self.prev_bssid and self.prev_bssid != cur_bssid:
                     # Log roam event
-                    with self.roam_path.open("a", newline="", encoding="utf-8") as f:
-                        csv.writer(f).writerow([
-                            start_ts.isoformat(), intf_info.get("ssid"), self.prev_bssid, cur_bssid,
-                            self.prev_signal or "", cur_signal or ""
-                        ])
+                    self._log_writer.write_row(self.roam_path, [
+                        ts_iso, ssid, self.prev_bssid, cur_bssid,
+                        self.prev_signal or "", cur_signal or ""
+                    ])
                 self.prev_bssid = cur_bssid
                 self.prev_signal = cur_signal
             # Update rolling buffers
@@ -894,119 +1899,253 @@ class MonitorThread(threading.Thread):
                 sig = float(cur_signal.replace("%", "")) if cur_signal else float('nan')
             except Exception:
                 sig = float('nan')
-            self.buf_signal.append(sig)
-            self.buf_ping_gw.append(ping_gw_avg if ping_gw_avg is not None else float('nan'))
-            self.buf_ping_rem.append(ping_rem_avg if ping_rem_avg is not None else float('nan'))
-            self.buf_throughput.append(throughput if throughput is not None else float('nan'))
-            self.buf_ts.append(start_ts)
+            with self._buf_lock:
+                self.buf_signal.append(sig)
+                self.buf_ping_gw.append(ping_gw_avg if ping_gw_avg is not None else float('nan'))
+                self.buf_ping_rem.append(ping_rem_avg if ping_rem_avg is not None else float('nan'))
+                self.buf_throughput.append(throughput if throughput is not None else float('nan'))
+                # numpy has no time zones; samples are stored as naive UTC
+                self.buf_ts.append(np.datetime64(now_ns // 1000, "us"))
+                self.sample_seq += 1
+            for name, value in (
+                ("signal", sig), ("ping_gw", ping_gw_avg), ("ping_rem", ping_rem_avg),
+                ("throughput", throughput),
+            ):
+                self.stats[name].push(float(value) if value is not None else float('nan'))
             # Write log entry
-            with self.csv_path.open("a", newline="", encoding="utf-8") as cf:
-                csv.writer(cf).writerow([
-                    start_ts.isoformat(), intf_info.get("state"), intf_info.get("ssid"), cur_bssid,
-                    cur_signal, intf_info.get("channel"), intf_info.get("radio_type"),
-                    ping_gw_avg if ping_gw_avg is not None else "", ping_gw_loss if ping_gw_loss is not None else "",
-                    ping_rem_avg if ping_rem_avg is not None else "", ping_rem_loss if ping_rem_loss is not None else "",
-                    throughput if throughput is not None else ""
-                ])
+            self._log_writer.write(self.csv_path, self.CSV_LINE.format(
+                ts_iso, csv_field(state), csv_field(ssid),
+                csv_field(cur_bssid), csv_field(cur_signal), csv_field(intf_info.get("channel")),
+                csv_field(intf_info.get("radio_type")),
+                ping_gw_avg if ping_gw_avg is not None else "", ping_gw_loss if ping_gw_loss is not None else "",
+                ping_rem_avg if ping_rem_avg is not None else "", ping_rem_loss if ping_rem_loss is not None else "",
+                throughput if throughput is not None else ""
+            ))
             # Also write JSONL for extended details
-            with self.jsonl_path.open("a", encoding="utf-8") as jf:
-                jf.write(json.dumps({
-                    "ts": start_ts.isoformat(),
+            if verbose_jsonl or scan_list or (state or "").lower() != "disconnected":
+                # null when the scan was skipped; [] when it found nothing
+                scan_entry: object = scan_list
+                if scan_list is not None:
+                    if not verbose_jsonl and scan_list is logged_scan:
+                        scan_entry = "unchanged"
+                    logged_scan = scan_list
+                self._log_writer.write(self.jsonl_path, self._encode({
+                    "ts": ts_iso,
                     "interface": intf_info,
-                    "scan": scan_list,
+                    "scan": scan_entry,
                     "ping_gateway": {"avg": ping_gw_avg, "loss": ping_gw_loss},
                     "ping_remote": {"avg": ping_rem_avg, "loss": ping_rem_loss},
                     "throughput": throughput,
                 }) + "\n")
-            # Rotate logs periodically (once per day) and trim folder size
-            if start_ts.time().hour == 0 and start_ts.time().minute == 0:
-                rotate_log(self.log_dir, retention_days, max_mb)
+            # Rotate logs once per calendar day (UTC) and trim folder size
+            today = start_ts.date()
+            if today != self._last_rotate_date:
+                rotate_log(self.log_dir, retention_days, max_mb,
+                           live=(self.csv_path, self.jsonl_path, self.roam_path))
+                self._last_rotate_date = today
+            # Refresh the health data in the background when it is due
+            now_mono = time.monotonic()
+            if now_mono >= self._health_due and (self._health_future is None or self._health_future.done()):
+                self._health_due = now_mono + self.HEALTH_REFRESH_SEC
+                self._health_future = self._health_pool.submit(self.refresh_health)
             # Notifications based on thresholds
             self._check_thresholds(sig, ping_gw_loss, ping_rem_loss, ping_gw_avg, ping_rem_avg)
             # Deliver summary to GUI
             summary = {
                 "timestamp": start_ts,
                 "interface": intf_info,
+                # Parsed signal_pct; NaN when unknown
+                "signal": sig,
                 "ping_gateway": {"avg": ping_gw_avg, "loss": ping_gw_loss},
                 "ping_remote": {"avg": ping_rem_avg, "loss": ping_rem_loss},
                 "throughput": throughput,
-                "signal_buffer": list(self.buf_signal),
-                "ping_gw_buffer": list(self.buf_ping_gw),
-                "ping_rem_buffer": list(self.buf_ping_rem),
-                "throughput_buffer": list(self.buf_throughput),
-                "ts_buffer": list(self.buf_ts),
-                "scan_flat": self._flatten_scan(scan_list),
+                "buffer_size": self.max_samples,
+                # Window maxima of the series that track one
+                "peaks": {name: st.max() for name, st in self.stats.items() if st.track_peak},
+                # None when the scan was skipped
+                "scan_flat": scan_flat,
             }
             self.summary_callback(summary)
             # Sleep until next sample or until stop
-            for _ in range(int(self.cfg["scan_interval"] * 10)):
-                if self.stop_event.is_set():
-                    break
-                time.sleep(0.1)
-        # Clean up scheduled timer on exit
+            if self.stop_event.wait(scan_interval):
+                break
+        # Clean up scheduled timer and write out buffered log lines on exit
         if self.scheduled_timer:
             self.scheduled_timer.cancel()
+        self._pool.shutdown(wait=False)
+        self._health_pool.shutdown(wait=False)
+        self._notifier.close()
+        self._log_writer.close()
 
     def stop(self) -> None:
         self.stop_event.set()
 
+    def snapshot_buffers(self) -> Dict[str, np.ndarray]:
+        """Return ordered copies of the chart buffers.
+
+        Summaries carry only scalars; the GUI copies the series through this
+        method when it actually redraws a chart.  ``seq`` is the sample count
+        the copies correspond to.
+        """
+        with self._buf_lock:
+            return {
+                "seq": self.sample_seq,
+                "signal": self.buf_signal.view(),
+                "ping_gw": self.buf_ping_gw.view(),
+                "ping_rem": self.buf_ping_rem.view(),
+                "throughput": self.buf_throughput.view(),
+                "ts": self.buf_ts.view(),
+            }
+
+    def flush_logs(self) -> None:
+        """Write any buffered log lines to disk immediately."""
+        self._log_writer.flush()
+
+    def refresh_health(self) -> Dict[str, object]:
+        """Recompute the health data that needs subprocesses or log reads.
+
+        Runs on the worker pool every ``HEALTH_REFRESH_SEC``; the GUI's
+        health check reads the result through ``health_snapshot()``.
+        """
+        svc = run_command(["sc", "query", "wlansvc"], timeout=5)
+        try:
+            cutoff = datetime.now(timezone.utc) - timedelta(hours=1)
+            roams = self.roam_history.count_since(self.roam_path, cutoff)
+        except Exception:
+            roams = 0
+        health = {
+            "wlansvc_running": "RUNNING" in svc,
+            "roams_last_hour": roams,
+            "log_issues": self._analyse_logs(),
+        }
+        with self._health_lock:
+            self.latest_health = health
+        return health
+
+    def health_snapshot(self) -> Dict[str, object]:
+        """Return the latest health data, or an empty dict before the first refresh."""
+        with self._health_lock:
+            return self.latest_health
+
+    def _analyse_logs(self) -> List[Tuple[str, str]]:
+        """Analyse recent logs to detect patterns like frequent disconnects or low average signal."""
+        issues: List[Tuple[str, str]] = []
+        try:
+            # Reuse the previous result while the log and thresholds are unchanged
+            thr = self.cfg.get("thresholds", {})
+            st = self.csv_path.stat()
+            key = (st.st_mtime_ns, st.st_size, thr.get("signal_fail", 35), thr.get("signal_warn", 55))
+            if self._log_issues_cache is not None and self._log_issues_cache[0] == key:
+                issues = list(self._log_issues_cache[1])
+            else:
+                issues = self._analyse_log_tail(thr)
+                self._log_issues_cache = (key, tuple(issues))
+            # Many roam events from historical log
+            try:
+                if self.roam_history.total(self.roam_path) > 20:
+                    issues.append(("INFO", "many_roam_events"))
+            except Exception:
+                pass
+            return issues
+        except Exception:
+            return issues
+
+    def _analyse_log_tail(self, thr: Mapping[str, object]) -> List[Tuple[str, str]]:
+        """Issues derived from the last 1000 rows of the sample log."""
+        issues: List[Tuple[str, str]] = []
+        # Last 1000 entries, read from the end of the memory‑mapped file
+        header, rows = tail_csv_log(self.csv_path, 1000)
+        if not header:
+            return issues
+        # Indices of fields
+        idx_state = header.index("state") if "state" in header else 1
+        idx_signal = header.index("signal_pct") if "signal_pct" in header else 4
+        # Whole‑column comparisons instead of per‑row parsing
+        states = np.char.lower(csv_column(rows, idx_state))
+        disc = int(np.count_nonzero(states == "disconnected"))
+        sig_vals = csv_column_floats(rows, idx_signal)
+        # Frequent disconnections
+        if disc > 5:
+            issues.append(("WARN", "frequent_disconnections"))
+        # Average signal
+        if sig_vals.size:
+            avg_sig = float(sig_vals.mean())
+            if avg_sig < thr.get("signal_fail", 35):
+                issues.append(("WARN", "low_average_signal_log"))
+            elif avg_sig < thr.get("signal_warn", 55):
+                issues.append(("INFO", "moderate_average_signal_log"))
+        return issues
+
     def _flatten_scan(self, scan: List[Dict[str, object]]) -> List[Dict[str, object]]:
-        """Flatten the scan list into a simple list of BSSID entries."""
+        """Flatten the scan list into a simple list of BSSID entries.
+
+        Entries keep scan order; consumers that want the strongest APs pick
+        them with ``heapq.nlargest`` and ``_signal_key``, which reads the
+        ``_sig_int`` field parsed here once per entry.
+        """
         flat = []
         for ap in scan:
             ssid = ap.get("ssid", "")
             for b in ap.get("bssids", []):
                 ch = b.get("channel", "")
                 sig = b.get("signal", "")
-                sig_pct = sig.replace("%", "").strip() if "%" in sig else sig
+                sig_pct = sig.rstrip("% \t")
+                try:
+                    sig_int = int(sig_pct)
+                except ValueError:
+                    sig_int = -1
                 flat.append({
                     "ssid": ssid,
                     "bssid": b.get("bssid", ""),
                     "channel": ch,
                     "band": band_for_channel(ch),
                     "signal_pct": sig_pct,
+                    "_sig_int": sig_int,
                 })
-        # Sort by descending signal
-        def keyfn(x):
-            try:
-                return -int(str(x["signal_pct"]))
-            except Exception:
-                return 0
-        return sorted(flat, key=keyfn)
+        return flat
+
+    def reload_thresholds(self) -> None:
+        """Copy the notification settings from ``cfg`` into attributes.
+
+        Called from ``__init__`` and again whenever the settings change, so
+        the per‑sample threshold check reads plain attributes.
+        """
+        notif = self.cfg.get("notifications", {})
+        self._thr_enabled = bool(notif.get("enabled"))
+        self._thr_signal = notif.get("signal_threshold", 35)
+        self._thr_loss = notif.get("loss_threshold", 20)
+        self._thr_latency = notif.get("latency_threshold", 200)
+        self._notifier.channels = notif.get("channels", [])
+        self._notifier.min_interval = float(notif.get("min_interval_sec", 30))
 
     def _check_thresholds(self, sig: float, gw_loss: Optional[int], rem_loss: Optional[int], gw_latency: Optional[float], rem_latency: Optional[float]) -> None:
         """Trigger notifications when thresholds are exceeded."""
-        if not self.cfg.get("notifications", {}).get("enabled"):
+        if not self._thr_enabled:
             return
-        thresholds = self.cfg.get("notifications", {})
-        def do_notify(msg):
-            # Use plyer notification if available and configured, else fallback to Tk
-            channels = thresholds.get("channels", [])
-            if "plyer" in channels and notification is not None:
-                try:
-                    notification.notify(title="Wi‑Fi Diagnostics", message=msg)
-                except Exception:
-                    pass
-            if "popup" in channels:
-                try:
-                    # Use non‑blocking pop‑up; schedule in main thread via callback
-                    # Here we simply print to console; GUI will handle notifications separately
-                    print(f"NOTIFICATION: {msg}")
-                except Exception:
-                    pass
+        tripped = self._notif_tripped
+        def check(key: str, bad: bool, msg: Callable[[], str]) -> None:
+            # Notify on the transition to bad; re‑arm after a run of good samples
+            if bad:
+                if key not in tripped:
+                    self._notifier.notify(key, msg())
+                tripped[key] = 0
+            elif key in tripped:
+                tripped[key] += 1
+                if tripped[key] >= self.NOTIFY_REARM_SAMPLES:
+                    del tripped[key]
         # Signal threshold
-        if sig is not None and not (sig != sig) and sig < thresholds.get("signal_threshold", 35):
-            do_notify(f"Signal strength low: {sig:.0f}%")
+        check("signal", sig is not None and not (sig != sig) and sig < self._thr_signal,
+              lambda: f"Signal strength low: {sig:.0f}%")
         # Loss thresholds
-        if gw_loss is not None and gw_loss > thresholds.get("loss_threshold", 20):
-            do_notify(f"Gateway packet loss high: {gw_loss}%")
-        if rem_loss is not None and rem_loss > thresholds.get("loss_threshold", 20):
-            do_notify(f"Internet packet loss high: {rem_loss}%")
+        check("gateway_loss", gw_loss is not None and gw_loss > self._thr_loss,
+              lambda: f"Gateway packet loss high: {gw_loss}%")
+        check("remote_loss", rem_loss is not None and rem_loss > self._thr_loss,
+              lambda: f"Internet packet loss high: {rem_loss}%")
         # Latency thresholds
-        if gw_latency is not None and gw_latency > thresholds.get("latency_threshold", 200):
-            do_notify(f"Gateway latency high: {gw_latency} ms")
-        if rem_latency is not None and rem_latency > thresholds.get("latency_threshold", 200):
-            do_notify(f"Internet latency high: {rem_latency} ms")
+        check("gateway_latency", gw_latency is not None and gw_latency > self._thr_latency,
+              lambda: f"Gateway latency high: {gw_latency} ms")
+        check("remote_latency", rem_latency is not None and rem_latency > self._thr_latency,
+              lambda: f"Internet latency high: {rem_latency} ms")
 
     def _schedule_diagnostics(self, delay_seconds: float) -> None:
         """Schedule a full health check to run after ``delay_seconds``."""
@@ -1032,6 +2171,31 @@ class MonitorThread(threading.Thread):
 # GUI Application
 ################################################################################
 
+# PNG bytes base64‑encoded per write when embedding report charts (multiple of 3)
+_REPORT_B64_CHUNK = 3 * 16 * 1024
+# Palette size of report chart PNGs; the charts use only a few colours
+_REPORT_PNG_COLOURS = 32
+
+def fill_treeview(tree: ttk.Treeview, rows: Iterable[Sequence[object]]) -> None:
+    """Replace all rows of ``tree`` in one bulk update.
+
+    A packed tree is unmapped while it is refilled so Tk lays it out once,
+    and rows go straight to the Tcl ``insert`` command, skipping the
+    per‑call option handling of ``Treeview.insert``.
+    """
+    info = tree.pack_info() if tree.winfo_manager() == "pack" else None
+    if info is not None:
+        tree.pack_forget()
+    children = tree.get_children()
+    if children:
+        tree.delete(*children)
+    call, path = tree.tk.call, str(tree)
+    for row in rows:
+        call(path, "insert", "", "end", "-values", tuple(row))
+    if info is not None:
+        tree.pack(**info)
+
+
 class WiFiGUI(tk.Tk):
     """Main Tkinter application for Wi‑Fi diagnostics.
 
@@ -1041,11 +2205,30 @@ class WiFiGUI(tk.Tk):
     diagnostics and report generation.  Settings can be adjusted and saved
     through the Settings tab.
     """
-    def __init__(self, config: Dict, database: Dict[str, Dict[str, object]]):
+    # Oldest monitor scan the channel diagnostics will still trust
+    SCAN_MAX_AGE_SEC = 300
+    # Extra wait, beyond one scan interval, for a scan the health check requested
+    SCAN_WAIT_SLACK_SEC = 20
+    # Settings MonitorThread only reads when it starts
+    MONITOR_RESTART_KEYS = (
+        "scan_interval", "ping_count", "ping_targets", "log_dir",
+        "log_retention_days", "max_log_mb", "scheduled_diagnostics",
+    )
+
+    def __init__(self, config: Dict, database: Mapping[str, Mapping[str, object]]):
         super().__init__()
         self.title("Wi‑Fi Diagnostics")
         self.config = config
         self.db = database
+        # Report chart figure and axes (created by the first report) and
+        # the PNG buffer reused by every report
+        self._report_lock = threading.Lock()
+        self._report_fig = None
+        self._report_buf = io.BytesIO()
+        self._report_axes: Tuple = ()
+        # Reverse lookup for issue rows, and rendered detail text per issue
+        self._title_to_id = {entry.get("title"): iid for iid, entry in database.items() if entry.get("title")}
+        self._issue_detail_cache: Dict[str, Tuple[object, ...]] = {}
         self.protocol("WM_DELETE_WINDOW", self.on_close)
         # Configure a reasonable default window size and allow the user to
         # resize freely.  Assign row/column weights on the root so child
@@ -1108,6 +2291,14 @@ class WiFiGUI(tk.Tk):
         self.diag_filter_category = tk.StringVar(value="All")
         self.diag_filter_severity = tk.StringVar(value="All")
 
+        # Roaming log timestamps, shared by the dashboard, channels tab and diagnostics
+        self._roam_history = RoamHistory()
+        # Parsed JSONL tail for the Logs tab, keyed on (path, mtime, size)
+        # (CSV header, CSV rows, JSONL lines) currently shown in the Logs tab
+        self._log_view: Tuple[List[str], List[List[str]], List[str]] = ([], [], [])
+        self._jsonl_cache: Optional[Tuple[Tuple[str, int, int], List[Tuple[datetime, Dict, str, str]]]] = None
+        # Last scan list and its _channel_plan() result
+        self._channel_memo: Optional[Tuple[List[Dict[str, object]], Tuple]] = None
         # Build UI for each tab
         self._build_dashboard()
         self._build_logs_tab()
@@ -1115,8 +2306,29 @@ class WiFiGUI(tk.Tk):
         self._build_diagnostics_tab()
         self._build_settings_tab()
         
+        # Latest summary from the monitor thread awaiting the UI thread
+        self._summary_lock = threading.Lock()
+        self._pending_summary: Optional[Dict] = None
+        self._flush_scheduled = False
         # Initialise monitor thread
-        self.monitor = MonitorThread(self.config, self.db, self._on_monitor_summary)
+        self.monitor = MonitorThread(self.config, self.db, self._on_monitor_summary, self._roam_history)
+        # Latest summaries not yet shown because their tab was hidden
+        self._stale_dashboard: Optional[Dict] = None
+        self._stale_channels: Optional[Dict] = None
+        # Most recent summary, and the last network scan with its monotonic time
+        self._last_summary: Optional[Dict] = None
+        # Numeric fields of the latest summary, read by the health check
+        self._last_metrics: Dict[str, object] = {}
+        self._last_scan_flat: Optional[Tuple[float, List[Dict[str, object]]]] = None
+        # Set whenever a summary brings a new scan; the scan the last health
+        # check judged the channels by
+        self._scan_arrived = threading.Event()
+        self._diag_scan_flat: Optional[List[Dict[str, object]]] = None
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        # Whether the window is shown (not minimised); tracked via Map/Unmap
+        self._window_mapped = True
+        self.bind("<Map>", self._on_window_map)
+        self.bind("<Unmap>", self._on_window_map)
         # Expose run_health_check to monitor (for scheduled diagnostics)
         setattr(self.monitor, 'gui_run_health_check', self.run_health_check)
         self.monitor.start()
@@ -1284,8 +2496,21 @@ class WiFiGUI(tk.Tk):
             self.ax_throughput.set_title("Download Speed (Mbps)")
             self.ax_throughput.set_ylim(0, 200)
             self.ax_throughput.grid(True, alpha=0.3)
+            # Persistent line artists.  Updates only swap their data and blit
+            # them over cached axes backgrounds (see _update_charts).
+            self._dash_lines = []
+            for ax, colour in ((self.ax_signal, "#2563eb"), (self.ax_gw_lat, "#047857"),
+                               (self.ax_rem_lat, "#be185d"), (self.ax_throughput, "#92400e")):
+                line, = ax.plot([], [], color=colour, animated=True)
+                self._dash_lines.append((ax, line))
+            self._dash_bg = None
+            self._last_drawn_seq = -1
+            self._needs_full_redraw = True
+            self._tick_n = 0
             self.fig_dashboard.tight_layout()
             self.canvas_dashboard = FigureCanvasTkAgg(self.fig_dashboard, master=chart_frame)
+            self.canvas_dashboard.mpl_connect("draw_event", self._on_dashboard_draw)
+            self.canvas_dashboard.mpl_connect("resize_event", self._on_dashboard_resize)
             # Use grid and sticky N S E W for the canvas so it expands within
             # the chart_frame when the window is resized.
             canvas_widget = self.canvas_dashboard.get_tk_widget()
@@ -1304,12 +2529,28 @@ class WiFiGUI(tk.Tk):
         """Enable monitoring and update button states."""
         if not self.monitor.is_alive():
             # Recreate monitor thread with latest config if needed
-            self.monitor = MonitorThread(self.config, self.db, self._on_monitor_summary)
+            self.monitor = MonitorThread(self.config, self.db, self._on_monitor_summary, self._roam_history)
             setattr(self.monitor, 'gui_run_health_check', self.run_health_check)
+            self._on_tab_changed()
             self.monitor.start()
         self.btn_start.configure(state="disabled")
         self.btn_stop.configure(state="normal")
 
+    def _restart_monitor(self) -> None:
+        """Replace the monitor with one using the current config.
+
+        The new thread starts once the old one has finished its current
+        sample; the UI polls for that instead of blocking on a join.
+        """
+        old = self.monitor
+        old.stop()
+        def start_when_stopped():
+            if old.is_alive():
+                self.after(100, start_when_stopped)
+            else:
+                self._start_monitor()
+        start_when_stopped()
+
     def _stop_monitor(self) -> None:
         """Stop monitoring thread and update button states."""
         self.monitor.stop()
@@ -1334,7 +2575,8 @@ class WiFiGUI(tk.Tk):
                 result = iperf3_speed_test(server, port, duration) if server else None
             else:
                 url = st_cfg.get("url")
-                result = http_speed_test(url) if url else None
+                duration = int(st_cfg.get("duration", 10))
+                result = http_speed_test(url, max_seconds=duration) if url else None
             self.monitor.last_speed_test = result
             # Update display on UI thread
             if result is not None:
@@ -1345,11 +2587,114 @@ class WiFiGUI(tk.Tk):
         self.speed_test_thread.start()
 
     def _on_monitor_summary(self, summary: Dict) -> None:
-        """Handle summary updates from the monitor thread on the UI thread."""
-        # Use after() to run on main thread
-        self.after(0, lambda: self._update_dashboard(summary))
-        # Provide scan data to channels tab
-        self.after(0, lambda: self._update_channels_tab(summary))
+        """Hand a summary from the monitor thread to the UI thread.
+
+        Summaries that arrive while an update is still queued replace the
+        pending one, so a busy UI thread draws only the latest sample.
+        """
+        with self._summary_lock:
+            self._pending_summary = summary
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+        self.after_idle(self._flush_summary)
+
+    def _flush_summary(self) -> None:
+        """Dispatch the latest pending summary on the UI thread."""
+        with self._summary_lock:
+            summary, self._pending_summary = self._pending_summary, None
+            self._flush_scheduled = False
+        if summary is not None:
+            self._dispatch_summary(summary)
+
+    def _dispatch_summary(self, summary: Dict) -> None:
+        """Update the visible tab now; keep the latest summary for hidden ones.
+
+        Hidden tabs are brought up to date from the stashed summary when
+        they are selected, so background samples cost no widget or figure
+        updates.
+        """
+        self._last_summary = summary
+        intf = summary.get("interface", {})
+        ping_gw = summary.get("ping_gateway", {})
+        ping_rem = summary.get("ping_remote", {})
+        sig = summary.get("signal", float('nan'))
+        self._last_metrics = {
+            "state": intf.get("state") or "disconnected",
+            "ssid": intf.get("ssid"),
+            # No reading counts as 0 %, as the dashboard badge shows
+            "signal": 0.0 if math.isnan(sig) else sig,
+            "gw_loss": ping_gw.get("loss"),
+            "gw_lat": ping_gw.get("avg"),
+            "rem_loss": ping_rem.get("loss"),
+            "rem_lat": ping_rem.get("avg"),
+        }
+        if summary.get("scan_flat") is not None:
+            self._last_scan_flat = (time.monotonic(), summary["scan_flat"])
+            self._scan_arrived.set()
+        # While the window is minimised no tab is visible
+        current = self.notebook.select() if self._window_mapped else None
+        if current == str(self.tab_dashboard):
+            self._stale_dashboard = None
+            self._update_dashboard(summary)
+        else:
+            self._stale_dashboard = summary
+        # Provide scan data to channels tab (unless the scan was skipped)
+        if summary.get("scan_flat") is not None:
+            if current == str(self.tab_channels):
+                self._stale_channels = None
+                self._update_channels_tab(summary)
+            else:
+                self._stale_channels = summary
+
+    def _recent_scan_flat(self) -> Optional[List[Dict[str, object]]]:
+        """Return the monitor's last network scan, or ``None`` if there is
+        none younger than ``SCAN_MAX_AGE_SEC``.
+
+        A missing or stale scan asks the monitor to scan in its next
+        sample, so a later call finds fresh data without running netsh here.
+        """
+        last = self._last_scan_flat
+        if last is None or time.monotonic() - last[0] > self.SCAN_MAX_AGE_SEC:
+            self.monitor.scan_requested.set()
+            return None
+        return last[1]
+
+    def _channel_plan(self, scan_flat: List[Dict[str, object]]
+                      ) -> Tuple[Counter, Counter, List[int], List[Tuple[int, int]]]:
+        """Return ``(ch24, ch5, off‑plan 2.4 GHz channels, crowded channels)``.
+
+        The result is memoised on the scan list itself; the monitor hands
+        out the same list while netsh reports an unchanged scan, so the
+        Channels tab and the diagnostics share one analysis per scan.
+
+        Called from the UI thread and the health‑check worker without a
+        lock: the memo is read once and replaced by a single tuple
+        assignment, and the plans are never mutated, so a race costs at
+        most a repeated computation.
+        """
+        memo = self._channel_memo
+        if memo is not None and memo[0] is scan_flat:
+            return memo[1]
+        ch24, ch5 = channel_counts(scan_flat)
+        plan = (ch24, ch5, [c for c in ch24 if c not in (1, 6, 11)], crowded_channels_24(ch24))
+        self._channel_memo = (scan_flat, plan)
+        return plan
+
+    def _on_tab_changed(self, event=None) -> None:
+        """Scan nearby networks only while the Channels tab is shown, and
+        catch the newly shown tab up with the latest summary."""
+        current = self.notebook.select() if self._window_mapped else None
+        if current == str(self.tab_channels):
+            self.monitor.scan_networks_enabled.set()
+        else:
+            self.monitor.scan_networks_enabled.clear()
+        if current == str(self.tab_dashboard) and self._stale_dashboard is not None:
+            summary, self._stale_dashboard = self._stale_dashboard, None
+            self._update_dashboard(summary)
+        elif current == str(self.tab_channels) and self._stale_channels is not None:
+            summary, self._stale_channels = self._stale_channels, None
+            self._update_channels_tab(summary)
 
     def _update_dashboard(self, summary: Dict) -> None:
         """Update dashboard badges and charts with new summary data."""
@@ -1376,11 +2721,10 @@ class WiFiGUI(tk.Tk):
             if v <= warn:
                 return "Badge.WARN"
             return "Badge.PASS"
-        # Signal
-        try:
-            sig_num = float(sig.replace("%", ""))
-        except Exception:
-            sig_num = float('nan')
+        # Signal; no reading counts as 0 %
+        sig_num = summary.get("signal", float('nan'))
+        if math.isnan(sig_num):
+            sig_num = 0.0
         self.style.configure("Badge.Signal", background=self.issue_sev_colors.get(badge_style(sig_num, thresholds.get("signal_warn", 55), thresholds.get("signal_fail", 35)).split(".")[-1], "#3b82f6"))
         # Packet loss and latency badges
         gw_loss = ping_gw.get("loss")
@@ -1395,57 +2739,85 @@ class WiFiGUI(tk.Tk):
         # Throughput
         if throughput is not None:
             self.var_throughput.set(f"{throughput:.1f} Mbps")
-        # Roams/hr: compute number of roams in the last hour from file
+        # Roams/hr: number of roams logged in the last hour
         try:
-            count = 0
             cutoff = datetime.now(timezone.utc) - timedelta(hours=1)
-            with (Path(self.config["log_dir"]) / "roaming_events.csv").open("r", encoding="utf-8", errors="ignore") as f:
-                next(f)  # skip header
-                for line in f:
-                    ts_str = line.split(",", 1)[0]
-                    try:
-                        ts_dt = datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
-                    except Exception:
-                        continue
-                    if ts_dt >= cutoff:
-                        count += 1
+            count = self._roam_history.count_since(self._roam_log_path(), cutoff)
             self.var_roams.set(f"{count}/h")
         except Exception:
             self.var_roams.set("0/h")
         # Last sample timestamp
         if ts:
             self.var_last_sample.set(ts.isoformat())
-        # Update mini charts
+        # Update mini charts, possibly only on every Nth sample
         layout = self.config.get("dashboard_layout", {})
-        if layout.get("show_charts", True):
-            # Use buffer lists; create x axis as index
-            xs = list(range(len(summary.get("signal_buffer", []))))
-            # Clear axes
-            self.ax_signal.clear(); self.ax_gw_lat.clear(); self.ax_rem_lat.clear(); self.ax_throughput.clear()
-            # Plot signal
-            sig_buf = summary.get("signal_buffer", [])
-            self.ax_signal.plot(xs, sig_buf, color="#2563eb")
-            self.ax_signal.set_title("Signal %")
-            self.ax_signal.set_ylim(0, 100)
-            self.ax_signal.grid(True, alpha=0.3)
-            # Plot latency and throughput
-            gw_buf = summary.get("ping_gw_buffer", [])
-            rem_buf = summary.get("ping_rem_buffer", [])
-            thr_buf = summary.get("throughput_buffer", [])
-            self.ax_gw_lat.plot(xs, gw_buf, color="#047857")
-            self.ax_gw_lat.set_title("Gateway Latency (ms)")
-            self.ax_gw_lat.set_ylim(0, max(300, max([v for v in gw_buf if not math.isnan(v)], default=0) * 1.2))
-            self.ax_gw_lat.grid(True, alpha=0.3)
-            self.ax_rem_lat.plot(xs, rem_buf, color="#be185d")
-            self.ax_rem_lat.set_title("Internet Latency (ms)")
-            self.ax_rem_lat.set_ylim(0, max(300, max([v for v in rem_buf if not math.isnan(v)], default=0) * 1.2))
-            self.ax_rem_lat.grid(True, alpha=0.3)
-            self.ax_throughput.plot(xs, thr_buf, color="#92400e")
-            self.ax_throughput.set_title("Download Speed (Mbps)")
-            self.ax_throughput.set_ylim(0, max(200, max([v for v in thr_buf if not math.isnan(v)], default=0) * 1.2))
-            self.ax_throughput.grid(True, alpha=0.3)
-            self.fig_dashboard.tight_layout()
+        if layout.get("show_charts", True) and hasattr(self, "canvas_dashboard"):
+            self._tick_n += 1
+            every_n = max(1, int(self.config.get("appearance", {}).get("chart_update_every_n_scans", 1)))
+            if self._tick_n % every_n == 0:
+                self._update_charts(summary)
+
+    def _update_charts(self, summary: Dict) -> None:
+        """Refresh the dashboard mini charts from the monitor's buffers.
+
+        Only the line artists are re‑rendered and blitted onto the cached
+        axes backgrounds.  A full canvas draw is requested only when an axis
+        limit changes or the window is resized.  Nothing is redrawn when no
+        sample arrived since the last refresh, and an axis whose series is
+        unchanged (e.g. throughput between speed tests) is not re‑blitted.
+        """
+        bufs = self.monitor.snapshot_buffers()
+        if bufs["seq"] == self._last_drawn_seq and not self._needs_full_redraw:
+            return
+        self._last_drawn_seq = bufs["seq"]
+        sig_buf, gw_buf, rem_buf, thr_buf = bufs["signal"], bufs["ping_gw"], bufs["ping_rem"], bufs["throughput"]
+        # The x axis spans the whole buffer so it only changes with the buffer size
+        xs = np.arange(len(sig_buf))
+        xlim = (0, max(1, (summary.get("buffer_size") or len(sig_buf)) - 1))
+        # Window maxima come precomputed from the monitor's SlidingStats
+        peaks = summary.get("peaks", {})
+        def peak(name: str) -> float:
+            return peaks.get(name) or 0
+        ylims = (
+            (0, 100),
+            (0, max(300, peak("ping_gw") * 1.2)),
+            (0, max(300, peak("ping_rem") * 1.2)),
+            (0, max(200, peak("throughput") * 1.2)),
+        )
+        changed = []
+        for (ax, line), data, ylim in zip(self._dash_lines, (sig_buf, gw_buf, rem_buf, thr_buf), ylims):
+            changed.append(not np.array_equal(line.get_ydata(), data, equal_nan=True))
+            line.set_data(xs, data)
+            if ax.get_xlim() != xlim:
+                ax.set_xlim(*xlim)
+                self._needs_full_redraw = True
+            if ax.get_ylim() != ylim:
+                ax.set_ylim(*ylim)
+                self._needs_full_redraw = True
+        if self._needs_full_redraw or self._dash_bg is None:
+            # _on_dashboard_draw captures fresh backgrounds and draws the lines
             self.canvas_dashboard.draw_idle()
+            return
+        canvas = self.canvas_dashboard
+        for (ax, line), bg, dirty in zip(self._dash_lines, self._dash_bg, changed):
+            if not dirty:
+                continue
+            canvas.restore_region(bg)
+            ax.draw_artist(line)
+            canvas.blit(ax.bbox)
+
+    def _on_dashboard_draw(self, event) -> None:
+        """After a full redraw, cache the axes backgrounds and overlay the lines."""
+        canvas = self.canvas_dashboard
+        self._dash_bg = [canvas.copy_from_bbox(ax.bbox) for ax, _ in self._dash_lines]
+        for ax, line in self._dash_lines:
+            ax.draw_artist(line)
+        self._needs_full_redraw = False
+
+    def _on_dashboard_resize(self, event) -> None:
+        """Re‑layout the charts; the cached backgrounds no longer fit."""
+        self.fig_dashboard.tight_layout()
+        self._needs_full_redraw = True
 
     ############################################################################
     # Logs Tab
@@ -1472,6 +2844,10 @@ class WiFiGUI(tk.Tk):
         ttk.Button(filter_frame, text="Clear", command=self._clear_log_filter).pack(side=tk.LEFT, padx=(6, 0))
         ttk.Button(filter_frame, text="Open CSV", command=self._open_csv).pack(side=tk.LEFT, padx=6)
         ttk.Button(filter_frame, text="Export", command=self._export_filtered_logs).pack(side=tk.LEFT, padx=6)
+        # JSONL records are shown as logged unless pretty‑printing is asked for
+        self.var_log_pretty = tk.BooleanVar(value=False)
+        ttk.Checkbutton(filter_frame, text="Pretty JSON", variable=self.var_log_pretty,
+                        command=self._apply_log_filter).pack(side=tk.LEFT, padx=6)
         # Treeview for CSV logs
         tree_frame = ttk.LabelFrame(frame, text="wifi_log.csv (filtered view)")
         tree_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=(0, 6))
@@ -1501,62 +2877,66 @@ class WiFiGUI(tk.Tk):
         search = self.var_log_search.get().lower().strip()
         start_ts = self._parse_log_time(self.var_log_start.get())
         end_ts = self._parse_log_time(self.var_log_end.get())
-        # Load CSV
-        rows = []
-        header = []
-        if csv_path.exists():
-            with csv_path.open("r", encoding="utf-8", errors="ignore") as f:
-                reader = csv.reader(f)
-                header = next(reader, [])
-                for row in reader:
-                    ts_str = row[0]
-                    try:
-                        ts = datetime.fromisoformat(ts_str)
-                    except Exception:
-                        continue
-                    if start_ts and ts < start_ts:
-                        continue
-                    if end_ts and ts > end_ts:
-                        continue
-                    if search and not any(search in cell.lower() for cell in row):
-                        continue
-                    rows.append(row)
+        # Logged timestamps are UTC‑aware; entered times are local
+        if start_ts and start_ts.tzinfo is None:
+            start_ts = start_ts.astimezone()
+        if end_ts and end_ts.tzinfo is None:
+            end_ts = end_ts.astimezone()
+        # Load the last 500 matching CSV rows without reading the whole file
+        header, rows = tail_csv_log(csv_path, 500, start_ts, end_ts, search)
         # Update treeview
-        self.tree_logs.delete(*self.tree_logs.get_children())
         if header:
             self.tree_logs.configure(columns=header)
             for col in header:
                 self.tree_logs.heading(col, text=col)
                 self.tree_logs.column(col, width=100, minwidth=80, stretch=True)
-            for row in rows[-500:]:  # show last 500 filtered entries
-                self.tree_logs.insert("", "end", values=row)
-        # Load JSONL and filter similarly
+        fill_treeview(self.tree_logs, rows)  # last 500 filtered entries
+        # Load JSONL and filter similarly, inserting the text in one call
         self.txt_json_logs.delete("1.0", tk.END)
-        if jsonl_path.exists():
+        pretty = self.var_log_pretty.get()
+        chunks = []
+        json_lines = []
+        try:
+            for ts_dt, entry, ln, ln_lower in self._jsonl_tail(jsonl_path):
+                if start_ts and ts_dt < start_ts:
+                    continue
+                if end_ts and ts_dt > end_ts:
+                    continue
+                if search and search not in ln_lower:
+                    continue
+                json_lines.append(ln)
+                chunks.append(json.dumps(entry, indent=2) + "\n\n" if pretty else ln + "\n")
+        except Exception:
+            pass
+        if chunks:
+            self.txt_json_logs.insert(tk.END, "".join(chunks))
+        self._log_view = (header, rows, json_lines)
+
+    def _jsonl_tail(self, path: Path) -> List[Tuple[datetime, Dict, str, str]]:
+        """Return the parsed last 1000 JSONL records as
+        (ts, entry, line, lowercased line).
+
+        The parse is cached against the file's size and mtime, so changing
+        the filter re‑filters parsed records instead of re‑decoding JSON and
+        timestamps.
+        """
+        try:
+            st = path.stat()
+        except OSError:
+            return []
+        key = (str(path), st.st_mtime_ns, st.st_size)
+        if self._jsonl_cache is not None and self._jsonl_cache[0] == key:
+            return self._jsonl_cache[1]
+        records = []
+        for ln in tail_lines(path, 1000):
             try:
-                with jsonl_path.open("r", encoding="utf-8", errors="ignore") as jf:
-                    lines = jf.readlines()
-                # Filter last 200 lines
-                lines = lines[-1000:]
-                for ln in lines:
-                    try:
-                        entry = json.loads(ln)
-                    except Exception:
-                        continue
-                    ts_str = entry.get("ts")
-                    try:
-                        ts_dt = datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
-                    except Exception:
-                        continue
-                    if start_ts and ts_dt < start_ts:
-                        continue
-                    if end_ts and ts_dt > end_ts:
-                        continue
-                    if search and search not in ln.lower():
-                        continue
-                    self.txt_json_logs.insert(tk.END, json.dumps(entry, indent=2) + "\n\n")
+                entry = json.loads(ln)
+                ts_dt = parse_log_ts(entry.get("ts"))
             except Exception:
-                pass
+                continue
+            records.append((ts_dt, entry, ln, ln.lower()))
+        self._jsonl_cache = (key, records)
+        return records
 
     def _clear_log_filter(self) -> None:
         """Clear log filters and reload logs."""
@@ -1580,18 +2960,18 @@ class WiFiGUI(tk.Tk):
         if not save_path:
             return
         try:
+            header, rows, json_lines = self._log_view
             with zipfile.ZipFile(save_path, "w", zipfile.ZIP_DEFLATED) as zf:
-                # Write filtered CSV to memory
-                csv_buf = io.StringIO()
-                writer = csv.writer(csv_buf)
-                # Write header
-                columns = self.tree_logs["columns"]
-                writer.writerow(columns)
-                for item in self.tree_logs.get_children():
-                    writer.writerow(self.tree_logs.item(item)["values"])
-                zf.writestr("wifi_log_filtered.csv", csv_buf.getvalue())
-                # Write filtered JSONL
-                zf.writestr("wifi_log_filtered.jsonl", self.txt_json_logs.get("1.0", tk.END))
+                # Stream the filtered rows straight into the archive members
+                with io.TextIOWrapper(zf.open("wifi_log_filtered.csv", "w"), encoding="utf-8", newline="") as f:
+                    writer = csv.writer(f)
+                    if header:
+                        writer.writerow(header)
+                    writer.writerows(rows)
+                # JSONL records as logged, whatever the display format
+                with io.TextIOWrapper(zf.open("wifi_log_filtered.jsonl", "w"), encoding="utf-8") as f:
+                    for ln in json_lines:
+                        f.write(ln + "\n")
             messagebox.showinfo("Export", "Logs exported successfully.")
         except Exception as e:
             messagebox.showerror("Export", f"Failed to export logs: {e}")
@@ -1599,6 +2979,30 @@ class WiFiGUI(tk.Tk):
     ############################################################################
     # Channels Tab
     ############################################################################
+    def _set_channel_bars(self, key: str, ax, counts: Mapping[int, int], colour: Callable[[int], str]) -> bool:
+        """Show ``counts`` as a bar chart on ``ax``.
+
+        When the set of channels is unchanged the existing bars are resized
+        in place; otherwise they are replaced.  Returns ``True`` when the
+        bars were replaced, i.e. the tick layout may have changed.
+        """
+        xs = sorted(counts)
+        ys = [counts[x] for x in xs]
+        old_xs, bars = self._channel_bars.get(key, ([], None))
+        if bars is not None and xs == old_xs:
+            for rect, h in zip(bars, ys):
+                rect.set_height(h)
+            ax.relim()
+            ax.autoscale_view()
+            return False
+        if bars is not None:
+            bars.remove()
+        bars = ax.bar(xs, ys, color=[colour(x) for x in xs]) if xs else None
+        self._channel_bars[key] = (xs, bars)
+        ax.relim()
+        ax.autoscale_view()
+        return True
+
     def _build_channels_tab(self) -> None:
         """Construct the Channels tab UI."""
         frame = self.tab_channels
@@ -1623,6 +3027,9 @@ class WiFiGUI(tk.Tk):
         self.ax_5.set_title("5 GHz channels")
         self.ax_5.set_xlabel("Channel")
         self.ax_5.set_ylabel("Count")
+        # Drawn bar containers per band and the counts they show
+        self._channel_bars: Dict[str, Tuple[List[int], object]] = {}
+        self._drawn_channels: Optional[Tuple[Counter, Counter]] = None
         self.canvas_channels = FigureCanvasTkAgg(self.fig_channels, master=charts)
         self.canvas_channels.get_tk_widget().pack(fill=tk.BOTH, expand=True)
         # Overlap warning
@@ -1642,80 +3049,46 @@ class WiFiGUI(tk.Tk):
         # Initially populate
         self._update_channels_tab({"scan_flat": []})
 
+    def _roam_log_path(self) -> Path:
+        return Path(self.config["log_dir"]) / "roaming_events.csv"
+
     def _update_channels_tab(self, summary: Dict) -> None:
         """Update channels tab based on the latest scan."""
         scan_flat = summary.get("scan_flat", [])
-        # Roam counts (today)
-        roam_path = Path(self.config["log_dir"]) / "roaming_events.csv"
-        today = datetime.now(timezone.utc).date()
-        roam_count = 0
-        last_roam = "—"
-        if roam_path.exists():
-            try:
-                with roam_path.open("r", encoding="utf-8", errors="ignore") as f:
-                    next(f)
-                    for line in f:
-                        parts = line.strip().split(",")
-                        if not parts:
-                            continue
-                        ts_str = parts[0]
-                        try:
-                            dt = datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
-                        except Exception:
-                            continue
-                        if dt.date() == today:
-                            roam_count += 1
-                        if not last_roam or dt > datetime.fromisoformat(last_roam.replace("Z", "+00:00")):
-                            last_roam = ts_str
-                self.var_roam_today.set(str(roam_count))
-                self.var_last_roam.set(last_roam)
-            except Exception:
-                pass
+        # Roam counts (today, UTC) and the most recent roam
+        roam_path = self._roam_log_path()
+        midnight = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+        try:
+            self.var_roam_today.set(str(self._roam_history.count_since(roam_path, midnight)))
+            self.var_last_roam.set(self._roam_history.last(roam_path) or "—")
+        except Exception:
+            pass
         # Channel histogram
-        ch24 = {}
-        ch5 = {}
-        for item in scan_flat:
-            try:
-                ch = int(item.get("channel", ""))
-            except Exception:
-                continue
-            band = item.get("band")
-            if band == "2.4":
-                ch24[ch] = ch24.get(ch, 0) + 1
-            elif band == "5":
-                ch5[ch] = ch5.get(ch, 0) + 1
-        # Update plots
-        self.ax_24.clear(); self.ax_5.clear()
-        if ch24:
-            xs = sorted(ch24.keys()); ys = [ch24[x] for x in xs]
-            colours = ["#c026d3" if x in (1, 6, 11) else "#c2410c" for x in xs]
-            self.ax_24.bar(xs, ys, color=colours)
-        self.ax_24.set_title("2.4 GHz channels")
-        self.ax_24.set_xlabel("Channel"); self.ax_24.set_ylabel("Count")
-        if ch5:
-            xs5 = sorted(ch5.keys()); ys5 = [ch5[x] for x in xs5]
-            self.ax_5.bar(xs5, ys5, color="#059669")
-        self.ax_5.set_title("5 GHz channels")
-        self.ax_5.set_xlabel("Channel"); self.ax_5.set_ylabel("Count")
-        self.fig_channels.tight_layout()
-        self.canvas_channels.draw_idle()
+        ch24, ch5, bad, crowded = self._channel_plan(scan_flat)
+        # Update plots, only when the counts differ from those drawn
+        if (ch24, ch5) != self._drawn_channels:
+            self._drawn_channels = (ch24, ch5)
+            relaid = self._set_channel_bars("24", self.ax_24, ch24,
+                                            lambda x: "#c026d3" if x in (1, 6, 11) else "#c2410c")
+            relaid |= self._set_channel_bars("5", self.ax_5, ch5, lambda x: "#059669")
+            if relaid:
+                self.fig_channels.tight_layout()
+            self.canvas_channels.draw_idle()
         # Overlap warning
         warn_msgs = []
         # Non‑1/6/11 channels
-        bad = [str(c) for c in ch24.keys() if c not in (1, 6, 11)]
         if bad:
-            warn_msgs.append("Non‑1/6/11 channels present: " + ", ".join(bad))
+            warn_msgs.append("Non‑1/6/11 channels present: " + ", ".join(map(str, bad)))
         # Crowded channels: if sum counts across ±2 channels >=8
-        for c in ch24.keys():
-            crowd = sum(ch24.get(cc, 0) for cc in range(c-2, c+3))
-            if crowd >= 8:
-                warn_msgs.append(f"Crowded around ch {c} (≈{crowd} BSSIDs)")
-                break
+        if crowded:
+            c, crowd = crowded[0]
+            warn_msgs.append(f"Crowded around ch {c} (≈{crowd} BSSIDs)")
         self.var_overlap_warn.set("; ".join(warn_msgs) if warn_msgs else "No obvious issues")
         # Top APs list
-        self.tree_top_aps.delete(*self.tree_top_aps.get_children())
-        for row in scan_flat[:15]:
-            self.tree_top_aps.insert("", "end", values=[row["ssid"], row["bssid"], row["channel"], row["band"], row["signal_pct"]])
+        fill_treeview(self.tree_top_aps, (
+            (row["ssid"], row["bssid"], row["channel"], row["band"], row["signal_pct"])
+            for row in heapq.nlargest(15, scan_flat, key=_signal_key)
+        ))
 
     ############################################################################
     # Diagnostics Tab
@@ -1747,12 +3120,21 @@ class WiFiGUI(tk.Tk):
         self.tree_issues.column("issue", width=300, anchor="w")
         self.tree_issues.pack(fill=tk.BOTH, expand=True)
         self.tree_issues.bind("<<TreeviewSelect>>", self._on_issue_select)
+        # Severity row colours
+        for sev in ["FAIL", "WARN", "INFO", "PASS"]:
+            colour = self.issue_sev_colors.get(sev)
+            if colour:
+                self.tree_issues.tag_configure(sev, background=colour, foreground="white")
+        # Issue id -> severity of the rows shown; rows use the issue id as item id
+        self._displayed_issues: Dict[str, str] = {}
         # Details panel
         details_frame = ttk.LabelFrame(frame, text="Details")
         details_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=(0, 10))
         # Text details
         self.text_issue_detail = tk.Text(details_frame, height=8, wrap="word", font=("Segoe UI", 9))
         self.text_issue_detail.pack(fill=tk.BOTH, expand=True, padx=6, pady=4)
+        # Bold style for headings
+        self.text_issue_detail.tag_configure("bold", font=("Segoe UI", 9, "bold"))
         # Chart for issue details (optional)
         self.fig_issue = Figure(figsize=(5.0, 2.2), dpi=100)
         self.ax_issue = self.fig_issue.add_subplot(111)
@@ -1765,106 +3147,83 @@ class WiFiGUI(tk.Tk):
         def worker():
             issues: List[Tuple[str, str]] = []  # (severity, issue_id)
             # Service & adapter checks
+            # Service, roaming and log data gathered by the monitor; a stopped
+            # monitor no longer refreshes it, so gather it here instead
+            if self.monitor.is_alive():
+                health = self.monitor.health_snapshot() or self.monitor.refresh_health()
+            else:
+                health = self.monitor.refresh_health()
             # Check WLAN service state
-            svc = run_command('sc query wlansvc', timeout=5)
-            if 'RUNNING' not in svc:
+            if not health["wlansvc_running"]:
                 issues.append(("FAIL", "wlan_service_not_running"))
-            # Adapter disconnected
-            if self.var_state.get().lower() == 'disconnected' or self.var_ssid.get() == "—":
-                issues.append(("FAIL", "adapter_disconnected"))
-            # Signal thresholds
-            try:
-                sig = float(self.var_signal.get().replace('%', ''))
-            except Exception:
-                sig = float('nan')
-            if not math.isnan(sig):
+            # Latest sample as numbers, captured from the monitor summary
+            m = self._last_metrics
+            # Before the first sample there is nothing to judge the link by
+            if m:
+                # Adapter disconnected
+                if m.get("state", "disconnected").lower() == 'disconnected' or not m.get("ssid"):
+                    issues.append(("FAIL", "adapter_disconnected"))
+                # Signal thresholds
+                sig = m.get("signal", float('nan'))
+                if not math.isnan(sig):
+                    thr = self.config.get("thresholds", {})
+                    if sig < thr.get("signal_fail", 35):
+                        issues.append(("FAIL", "weak_signal"))
+                    elif sig < thr.get("signal_warn", 55):
+                        issues.append(("WARN", "moderate_signal"))
+                # Packet loss and latency thresholds
+                gw_loss, rem_loss = m.get("gw_loss"), m.get("rem_loss")
+                gw_lat, rem_lat = m.get("gw_lat"), m.get("rem_lat")
                 thr = self.config.get("thresholds", {})
-                if sig < thr.get("signal_fail", 35):
-                    issues.append(("FAIL", "weak_signal"))
-                elif sig < thr.get("signal_warn", 55):
-                    issues.append(("WARN", "moderate_signal"))
-            # Packet loss and latency thresholds
-            try:
-                gw_loss = int(self.var_loss_gw.get().replace('%', ''))
-            except Exception:
-                gw_loss = None
-            try:
-                rem_loss = int(self.var_loss_rem.get().replace('%', ''))
-            except Exception:
-                rem_loss = None
-            try:
-                gw_lat = float(self.var_latency_gw.get())
-            except Exception:
-                gw_lat = None
-            try:
-                rem_lat = float(self.var_latency_rem.get())
-            except Exception:
-                rem_lat = None
-            thr = self.config.get("thresholds", {})
-            if gw_loss is not None:
-                if gw_loss > thr.get("loss_fail", 20):
-                    issues.append(("FAIL", "gateway_packet_loss"))
-                elif gw_loss > thr.get("loss_warn", 10):
-                    issues.append(("WARN", "gateway_packet_loss"))
-            if rem_loss is not None:
-                if rem_loss > thr.get("loss_fail", 20):
-                    issues.append(("FAIL", "internet_packet_loss"))
-                elif rem_loss > thr.get("loss_warn", 10):
-                    issues.append(("WARN", "internet_packet_loss"))
-            if gw_lat is not None:
-                if gw_lat > thr.get("latency_fail", 300):
-                    issues.append(("FAIL", "gateway_high_latency"))
-                elif gw_lat > thr.get("latency_warn", 150):
-                    issues.append(("WARN", "gateway_high_latency"))
-            if rem_lat is not None:
-                if rem_lat > thr.get("latency_fail", 300):
-                    issues.append(("FAIL", "internet_high_latency"))
-                elif rem_lat > thr.get("latency_warn", 150):
-                    issues.append(("WARN", "internet_high_latency"))
+                if gw_loss is not None:
+                    if gw_loss > thr.get("loss_fail", 20):
+                        issues.append(("FAIL", "gateway_packet_loss"))
+                    elif gw_loss > thr.get("loss_warn", 10):
+                        issues.append(("WARN", "gateway_packet_loss"))
+                if rem_loss is not None:
+                    if rem_loss > thr.get("loss_fail", 20):
+                        issues.append(("FAIL", "internet_packet_loss"))
+                    elif rem_loss > thr.get("loss_warn", 10):
+                        issues.append(("WARN", "internet_packet_loss"))
+                if gw_lat is not None:
+                    if gw_lat > thr.get("latency_fail", 300):
+                        issues.append(("FAIL", "gateway_high_latency"))
+                    elif gw_lat > thr.get("latency_warn", 150):
+                        issues.append(("WARN", "gateway_high_latency"))
+                if rem_lat is not None:
+                    if rem_lat > thr.get("latency_fail", 300):
+                        issues.append(("FAIL", "internet_high_latency"))
+                    elif rem_lat > thr.get("latency_warn", 150):
+                        issues.append(("WARN", "internet_high_latency"))
             # Roaming frequency (per hour)
-            roam_count = 0
-            now = datetime.now(timezone.utc)
-            try:
-                with (Path(self.config["log_dir"]) / "roaming_events.csv").open("r", encoding="utf-8", errors="ignore") as f:
-                    next(f)
-                    for line in f:
-                        ts_str = line.split(',', 1)[0]
-                        dt = datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
-                        if (now - dt).total_seconds() <= 3600:
-                            roam_count += 1
-            except Exception:
-                pass
+            roam_count = health["roams_last_hour"]
             if roam_count >= 6:
                 issues.append(("FAIL", "excessive_roaming"))
             elif roam_count >= 3:
                 issues.append(("WARN", "moderate_roaming"))
             # Channel plan and crowding
-            # Evaluate based on current channels data
-            # We already computed this in channels tab; reuse that info if possible
-            # Check for bad channels
-            summary = {
-                "scan_flat": getattr(self.monitor, "_flatten_scan", lambda x: [])(parse_netsh_scan(run_command("netsh wlan show networks mode=bssid")))
-            }
-            ch24 = {}
-            for item in summary["scan_flat"]:
-                if item.get("band") == "2.4":
-                    try:
-                        c = int(item.get("channel"))
-                        ch24[c] = ch24.get(c, 0) + 1
-                    except Exception:
-                        continue
-            if any(c not in (1, 6, 11) for c in ch24):
-                issues.append(("WARN", "bad_channel_plan"))
-            # Crowding
-            for c in ch24:
-                crowd = sum(ch24.get(cc, 0) for cc in range(c-2, c+3))
-                if crowd >= 8:
+            # Reuse the monitor's latest scan.  A stale one makes the monitor
+            # scan in its next sample, so wait for that before giving up.
+            self._scan_arrived.clear()
+            scan_flat = self._recent_scan_flat()
+            # A stopped monitor never answers the request
+            if scan_flat is None and self.monitor.is_alive():
+                wait = self.config.get("scan_interval", 10) + self.SCAN_WAIT_SLACK_SEC
+                if self._scan_arrived.wait(wait):
+                    scan_flat = self._recent_scan_flat()
+            self._diag_scan_flat = scan_flat
+            if scan_flat is None:
+                issues.append(("INFO", "channel_check_skipped"))
+            else:
+                _, _, bad, crowded = self._channel_plan(scan_flat)
+                if bad:
+                    issues.append(("WARN", "bad_channel_plan"))
+                # Crowding
+                if crowded:
                     issues.append(("WARN", "crowded_channel"))
-                    break
             # Power management and driver issues (heuristics based on logs)
             # Analyse historical logs for frequent disconnects, low signal etc.
-            log_issues = self._analyse_logs()
-            issues.extend(log_issues)
+            issues.extend(health["log_issues"])
             # Remove duplicates and keep worst severity
             unique: Dict[str, str] = {}
             for sev, iid in issues:
@@ -1894,84 +3253,15 @@ class WiFiGUI(tk.Tk):
             self.after(0, update_ui)
         threading.Thread(target=worker, daemon=True).start()
 
-    def _analyse_logs(self) -> List[Tuple[str, str]]:
-        """Analyse recent logs to detect patterns like frequent disconnects or low average signal."""
-        issues: List[Tuple[str, str]] = []
-        log_path = Path(self.config["log_dir"]) / "wifi_log.csv"
-        if not log_path.exists():
-            return issues
-        try:
-            # Read last 1000 entries
-            rows = []
-            with log_path.open("r", encoding="utf-8", errors="ignore") as f:
-                reader = csv.reader(f)
-                header = next(reader, [])
-                for row in reader:
-                    rows.append(row)
-            rows = rows[-1000:]
-            # Indices of fields
-            idx_state = header.index("state") if "state" in header else 1
-            idx_signal = header.index("signal_pct") if "signal_pct" in header else 4
-            idx_ping_gw_loss = header.index("ping_gateway_loss") if "ping_gateway_loss" in header else 8
-            idx_ping_rem_loss = header.index("ping_remote_loss") if "ping_remote_loss" in header else 10
-            # Compute metrics
-            disc = 0
-            sig_vals = []
-            gw_loss_high = 0
-            rem_loss_high = 0
-            for row in rows:
-                if idx_state < len(row) and row[idx_state].lower() == 'disconnected':
-                    disc += 1
-                if idx_signal < len(row):
-                    try:
-                        s = float(row[idx_signal].replace('%',''))
-                        sig_vals.append(s)
-                    except Exception:
-                        pass
-                if idx_ping_gw_loss < len(row):
-                    try:
-                        l = int(row[idx_ping_gw_loss])
-                        if l > self.config.get("thresholds", {}).get("loss_warn", 10):
-                            gw_loss_high += 1
-                    except Exception:
-                        pass
-                if idx_ping_rem_loss < len(row):
-                    try:
-                        l2 = int(row[idx_ping_rem_loss])
-                        if l2 > self.config.get("thresholds", {}).get("loss_warn", 10):
-                            rem_loss_high += 1
-                    except Exception:
-                        pass
-            # Frequent disconnections
-            if disc > 5:
-                issues.append(("WARN", "frequent_disconnections"))
-            # Average signal
-            if sig_vals:
-                avg_sig = sum(sig_vals) / len(sig_vals)
-                if avg_sig < self.config.get("thresholds", {}).get("signal_fail", 35):
-                    issues.append(("WARN", "low_average_signal_log"))
-                elif avg_sig < self.config.get("thresholds", {}).get("signal_warn", 55):
-                    issues.append(("INFO", "moderate_average_signal_log"))
-            # Many roam events from historical log
-            roam_log = Path(self.config["log_dir"]) / "roaming_events.csv"
-            if roam_log.exists():
-                try:
-                    with roam_log.open("r", encoding="utf-8", errors="ignore") as f:
-                        next(f)
-                        lines = f.readlines()
-                    if len(lines) > 20:
-                        issues.append(("INFO", "many_roam_events"))
-                except Exception:
-                    pass
-            return issues
-        except Exception:
-            return issues
-
     def _populate_diagnostics_ui(self) -> None:
-        """Refresh the diagnostics list based on current_issues and filters."""
-        self.tree_issues.delete(*self.tree_issues.get_children())
+        """Refresh the diagnostics list based on current_issues and filters.
+
+        Only rows that appear, disappear or change severity touch the tree;
+        an unchanged list leaves the tree and the details panel alone.
+        """
         cat_filter = self.diag_filter_category.get()
         sev_filter = self.diag_filter_severity.get()
+        wanted: Dict[str, str] = {}
         for sev, iid in self.current_issues:
             entry = self.db.get(iid, {})
             category = entry.get("category", "")
@@ -1979,16 +3269,50 @@ class WiFiGUI(tk.Tk):
                 continue
             if (sev_filter != "All" and sev != sev_filter):
                 continue
-            self.tree_issues.insert("", "end", values=(sev, entry.get("title", iid)), tags=(sev, iid))
-        # Apply tag styles
-        for sev in ["FAIL", "WARN", "INFO", "PASS"]:
-            colour = self.issue_sev_colors.get(sev)
-            if colour:
-                self.tree_issues.tag_configure(sev, background=colour, foreground="white")
+            wanted[iid] = sev
+        shown = self._displayed_issues
+        if wanted == shown and list(wanted) == list(shown):
+            return
+        tree = self.tree_issues
+        gone = [iid for iid in shown if iid not in wanted]
+        if gone:
+            tree.delete(*gone)
+        for iid, sev in wanted.items():
+            if iid not in shown:
+                values = (sev, self.db.get(iid, {}).get("title", iid))
+                tree.insert("", "end", iid=iid, values=values, tags=(sev, iid))
+            elif shown[iid] != sev:
+                tree.item(iid, values=(sev, tree.set(iid, "issue")), tags=(sev, iid))
+        if list(wanted) != [iid for iid in shown if iid in wanted] + [iid for iid in wanted if iid not in shown]:
+            tree.set_children("", *wanted)
+        self._displayed_issues = wanted
         # Clear details
         self.text_issue_detail.delete("1.0", tk.END)
         self.ax_issue.clear(); self.canvas_issue.draw_idle()
 
+    def _issue_detail(self, issue_id: str) -> Tuple[object, ...]:
+        """Return the detail text of an issue as ``Text.insert`` arguments.
+
+        The result alternates text and tag tuples and is built once per
+        issue; the troubleshooting database does not change at run time.
+        """
+        cached = self._issue_detail_cache.get(issue_id)
+        if cached is not None:
+            return cached
+        entry = self.db.get(issue_id, {})
+        parts: List[object] = [f"{entry.get('title')}\n\n{entry.get('description')}\n\n", ()]
+        if entry.get("causes"):
+            parts += ["Possible Causes:\n", ("bold",),
+                      "".join(f" • {c}\n" for c in entry["causes"]) + "\n", ()]
+        if entry.get("resolutions"):
+            parts += ["Recommended Fixes:\n", ("bold",),
+                      "".join(f" • {r}\n" for r in entry["resolutions"]) + "\n", ()]
+        if entry.get("links"):
+            parts += ["Links:\n", ("bold",),
+                      "".join(f" • {label} ({cmd})\n" for label, cmd in entry["links"]), ()]
+        cached = self._issue_detail_cache[issue_id] = tuple(parts)
+        return cached
+
     def _on_issue_select(self, event) -> None:
         """Display details for the selected issue."""
         sel = self.tree_issues.selection()
@@ -2000,78 +3324,49 @@ class WiFiGUI(tk.Tk):
             return
         sev, title = values[0], values[1]
         # Find issue id by title
-        issue_id = None
-        for iid, entry in self.db.items():
-            if entry.get("title") == title:
-                issue_id = iid
-                break
+        issue_id = self._title_to_id.get(title)
         if not issue_id:
             self.text_issue_detail.delete("1.0", tk.END)
             self.text_issue_detail.insert(tk.END, "Unknown issue.")
             return
-        entry = self.db.get(issue_id, {})
-        # Display description, causes, resolutions
+        # Display description, causes, resolutions in one insert call
         self.text_issue_detail.delete("1.0", tk.END)
-        self.text_issue_detail.insert(tk.END, f"{entry.get('title')}\n\n")
-        self.text_issue_detail.insert(tk.END, f"{entry.get('description')}\n\n")
-        if entry.get("causes"):
-            self.text_issue_detail.insert(tk.END, "Possible Causes:\n", ("bold",))
-            for c in entry["causes"]:
-                self.text_issue_detail.insert(tk.END, f" • {c}\n")
-            self.text_issue_detail.insert(tk.END, "\n")
-        if entry.get("resolutions"):
-            self.text_issue_detail.insert(tk.END, "Recommended Fixes:\n", ("bold",))
-            for r in entry["resolutions"]:
-                self.text_issue_detail.insert(tk.END, f" • {r}\n")
-            self.text_issue_detail.insert(tk.END, "\n")
-        if entry.get("links"):
-            self.text_issue_detail.insert(tk.END, "Links:\n", ("bold",))
-            for label, cmd in entry["links"]:
-                self.text_issue_detail.insert(tk.END, f" • {label} ({cmd})\n")
-        # Bold style for headings
-        self.text_issue_detail.tag_configure("bold", font=("Segoe UI", 9, "bold"))
+        self.text_issue_detail.insert(tk.END, *self._issue_detail(issue_id))
         # Draw graph for this issue (if applicable)
         self.ax_issue.clear()
         fig_needed = False
+        bufs = self.monitor.snapshot_buffers()
         if issue_id in ("weak_signal", "low_average_signal_log", "moderate_signal", "moderate_average_signal_log"):
             # Plot signal history
-            xs = list(range(len(self.monitor.buf_signal)))
-            self.ax_issue.plot(xs, list(self.monitor.buf_signal), color="#2563eb")
+            sig = bufs["signal"]
+            self.ax_issue.plot(np.arange(len(sig)), sig, color="#2563eb")
             self.ax_issue.set_title("Signal History (%)")
             self.ax_issue.set_ylim(0, 100)
             fig_needed = True
         elif issue_id in ("gateway_packet_loss", "internet_packet_loss"):
-            # Plot packet loss occurrences (bar)
-            gw_losses = [l for l in self.monitor.buf_ping_gw if not math.isnan(l)]
-            rem_losses = [l for l in self.monitor.buf_ping_rem if not math.isnan(l)]
-            if issue_id == "gateway_packet_loss" and gw_losses:
-                self.ax_issue.plot(list(range(len(gw_losses))), gw_losses, color="#f59e0b")
-                self.ax_issue.set_title("Gateway Latency History (ms)")
-                fig_needed = True
-            if issue_id == "internet_packet_loss" and rem_losses:
-                self.ax_issue.plot(list(range(len(rem_losses))), rem_losses, color="#be185d")
-                self.ax_issue.set_title("Internet Latency History (ms)")
+            # Plot the answered pings of the affected target only
+            if issue_id == "gateway_packet_loss":
+                series, colour, title = bufs["ping_gw"], "#f59e0b", "Gateway Latency History (ms)"
+            else:
+                series, colour, title = bufs["ping_rem"], "#be185d", "Internet Latency History (ms)"
+            answered = series[~np.isnan(series)]
+            if len(answered):
+                self.ax_issue.plot(np.arange(len(answered)), answered, color=colour)
+                self.ax_issue.set_title(title)
                 fig_needed = True
         elif issue_id in ("gateway_high_latency", "internet_high_latency"):
             # Plot latency history
-            buf = self.monitor.buf_ping_gw if issue_id == "gateway_high_latency" else self.monitor.buf_ping_rem
-            self.ax_issue.plot(list(range(len(buf))), list(buf), color="#ea580c")
+            lat = bufs["ping_gw"] if issue_id == "gateway_high_latency" else bufs["ping_rem"]
+            self.ax_issue.plot(np.arange(len(lat)), lat, color="#ea580c")
             self.ax_issue.set_title("Latency History (ms)")
             fig_needed = True
         elif issue_id in ("bad_channel_plan", "crowded_channel"):
-            # Plot channel histogram from last scan
-            scan_flat = getattr(self.monitor, "_flatten_scan", lambda x: [])(parse_netsh_scan(run_command("netsh wlan show networks mode=bssid")))
-            ch24 = {}
-            for item in scan_flat:
-                if item.get("band") == "2.4":
-                    try:
-                        c = int(item.get("channel", ""))
-                        ch24[c] = ch24.get(c, 0) + 1
-                    except Exception:
-                        continue
-            self.ax_issue.bar(ch24.keys(), ch24.values(), color="#facc15")
-            self.ax_issue.set_title("2.4 GHz Channel Histogram")
-            fig_needed = True
+            # Plot the channel histogram of the scan the issue was raised from
+            if self._diag_scan_flat is not None:
+                ch24 = self._channel_plan(self._diag_scan_flat)[0]
+                self.ax_issue.bar(ch24.keys(), ch24.values(), color="#facc15")
+                self.ax_issue.set_title("2.4 GHz Channel Histogram")
+                fig_needed = True
         if fig_needed:
             self.fig_issue.tight_layout()
             self.canvas_issue.draw_idle()
@@ -2083,278 +3378,395 @@ class WiFiGUI(tk.Tk):
     # Settings Tab
     ############################################################################
     def _build_settings_tab(self) -> None:
-        """Construct the Settings tab UI."""
+        """Construct the Settings tab UI.
+
+        Each section's widgets are built the first time its tab is shown;
+        sections never opened keep their current config when saving.
+        """
         frame = self.tab_settings
         pad = {"padx": 10, "pady": 6}
-        # Use Notebook inside settings to organise sections
-        nb = ttk.Notebook(frame)
-        nb.pack(fill=tk.BOTH, expand=True)
+        # Tk variables of the sections built so far, read by save_settings
+        v: Dict[str, tk.Variable] = {}
         # Appearance section
-        sec_app = ttk.Frame(nb)
-        nb.add(sec_app, text="Appearance")
-        ttk.Label(sec_app, text="Theme:").grid(row=0, column=0, sticky="w", **pad)
-        theme_var = tk.StringVar(value=self.config.get("appearance", {}).get("theme", "light"))
-        ttk.Combobox(sec_app, values=["light", "dark"], textvariable=theme_var, state="readonly")\
-            .grid(row=0, column=1, sticky="w", **pad)
-        ttk.Label(sec_app, text="Accent colour:").grid(row=1, column=0, sticky="w", **pad)
-        accent_var = tk.StringVar(value=self.config.get("appearance", {}).get("accent_color", "#0066cc"))
-        ttk.Entry(sec_app, textvariable=accent_var).grid(row=1, column=1, sticky="w", **pad)
-        ttk.Label(sec_app, text="Font size:").grid(row=2, column=0, sticky="w", **pad)
-        font_var = tk.IntVar(value=self.config.get("appearance", {}).get("font_size", 10))
-        ttk.Spinbox(sec_app, from_=8, to=16, textvariable=font_var, width=5).grid(row=2, column=1, sticky="w", **pad)
+        def build_appearance(sec: ttk.Frame) -> None:
+            ttk.Label(sec, text="Theme:").grid(row=0, column=0, sticky="w", **pad)
+            v["theme"] = tk.StringVar(value=self.config.get("appearance", {}).get("theme", "light"))
+            ttk.Combobox(sec, values=["light", "dark"], textvariable=v["theme"], state="readonly")\
+                .grid(row=0, column=1, sticky="w", **pad)
+            ttk.Label(sec, text="Accent colour:").grid(row=1, column=0, sticky="w", **pad)
+            v["accent"] = tk.StringVar(value=self.config.get("appearance", {}).get("accent_color", "#0066cc"))
+            ttk.Entry(sec, textvariable=v["accent"]).grid(row=1, column=1, sticky="w", **pad)
+            ttk.Label(sec, text="Font size:").grid(row=2, column=0, sticky="w", **pad)
+            v["font"] = tk.IntVar(value=self.config.get("appearance", {}).get("font_size", 10))
+            ttk.Spinbox(sec, from_=8, to=16, textvariable=v["font"], width=5).grid(row=2, column=1, sticky="w", **pad)
+            ttk.Label(sec, text="Update charts every N scans:").grid(row=3, column=0, sticky="w", **pad)
+            v["chart_every"] = tk.IntVar(value=self.config.get("appearance", {}).get("chart_update_every_n_scans", 1))
+            ttk.Spinbox(sec, from_=1, to=10, textvariable=v["chart_every"], width=5).grid(row=3, column=1, sticky="w", **pad)
         # Dashboard layout section
-        sec_dash = ttk.Frame(nb)
-        nb.add(sec_dash, text="Dashboard")
-        dl = self.config.get("dashboard_layout", {})
-        self.var_show_signal = tk.BooleanVar(value=dl.get("show_signal", True))
-        self.var_show_latency = tk.BooleanVar(value=dl.get("show_latency", True))
-        self.var_show_roams = tk.BooleanVar(value=dl.get("show_roams", True))
-        self.var_show_throughput = tk.BooleanVar(value=dl.get("show_throughput", True))
-        self.var_show_charts = tk.BooleanVar(value=dl.get("show_charts", True))
-        ttk.Checkbutton(sec_dash, text="Show signal badge", variable=self.var_show_signal).grid(row=0, column=0, sticky="w", **pad)
-        ttk.Checkbutton(sec_dash, text="Show latency & loss badges", variable=self.var_show_latency).grid(row=1, column=0, sticky="w", **pad)
-        ttk.Checkbutton(sec_dash, text="Show roaming badge", variable=self.var_show_roams).grid(row=2, column=0, sticky="w", **pad)
-        ttk.Checkbutton(sec_dash, text="Show throughput badge", variable=self.var_show_throughput).grid(row=3, column=0, sticky="w", **pad)
-        ttk.Checkbutton(sec_dash, text="Show live charts", variable=self.var_show_charts).grid(row=4, column=0, sticky="w", **pad)
+        def build_dashboard_layout(sec: ttk.Frame) -> None:
+            dl = self.config.get("dashboard_layout", {})
+            v["show_signal"] = tk.BooleanVar(value=dl.get("show_signal", True))
+            v["show_latency"] = tk.BooleanVar(value=dl.get("show_latency", True))
+            v["show_roams"] = tk.BooleanVar(value=dl.get("show_roams", True))
+            v["show_throughput"] = tk.BooleanVar(value=dl.get("show_throughput", True))
+            v["show_charts"] = tk.BooleanVar(value=dl.get("show_charts", True))
+            ttk.Checkbutton(sec, text="Show signal badge", variable=v["show_signal"]).grid(row=0, column=0, sticky="w", **pad)
+            ttk.Checkbutton(sec, text="Show latency & loss badges", variable=v["show_latency"]).grid(row=1, column=0, sticky="w", **pad)
+            ttk.Checkbutton(sec, text="Show roaming badge", variable=v["show_roams"]).grid(row=2, column=0, sticky="w", **pad)
+            ttk.Checkbutton(sec, text="Show throughput badge", variable=v["show_throughput"]).grid(row=3, column=0, sticky="w", **pad)
+            ttk.Checkbutton(sec, text="Show live charts", variable=v["show_charts"]).grid(row=4, column=0, sticky="w", **pad)
         # Thresholds section
-        sec_thr = ttk.Frame(nb)
-        nb.add(sec_thr, text="Thresholds")
-        thr = self.config.get("thresholds", {})
-        ttk.Label(sec_thr, text="Signal warn (%):").grid(row=0, column=0, sticky="w", **pad)
-        sig_warn_var = tk.IntVar(value=thr.get("signal_warn", 55))
-        ttk.Spinbox(sec_thr, from_=10, to=90, textvariable=sig_warn_var, width=5).grid(row=0, column=1, sticky="w", **pad)
-        ttk.Label(sec_thr, text="Signal fail (%):").grid(row=1, column=0, sticky="w", **pad)
-        sig_fail_var = tk.IntVar(value=thr.get("signal_fail", 35))
-        ttk.Spinbox(sec_thr, from_=5, to=80, textvariable=sig_fail_var, width=5).grid(row=1, column=1, sticky="w", **pad)
-        ttk.Label(sec_thr, text="Loss warn (%):").grid(row=2, column=0, sticky="w", **pad)
-        loss_warn_var = tk.IntVar(value=thr.get("loss_warn", 10))
-        ttk.Spinbox(sec_thr, from_=0, to=100, textvariable=loss_warn_var, width=5).grid(row=2, column=1, sticky="w", **pad)
-        ttk.Label(sec_thr, text="Loss fail (%):").grid(row=3, column=0, sticky="w", **pad)
-        loss_fail_var = tk.IntVar(value=thr.get("loss_fail", 20))
-        ttk.Spinbox(sec_thr, from_=0, to=100, textvariable=loss_fail_var, width=5).grid(row=3, column=1, sticky="w", **pad)
-        ttk.Label(sec_thr, text="Latency warn (ms):").grid(row=4, column=0, sticky="w", **pad)
-        lat_warn_var = tk.IntVar(value=thr.get("latency_warn", 150))
-        ttk.Spinbox(sec_thr, from_=10, to=1000, textvariable=lat_warn_var, width=6).grid(row=4, column=1, sticky="w", **pad)
-        ttk.Label(sec_thr, text="Latency fail (ms):").grid(row=5, column=0, sticky="w", **pad)
-        lat_fail_var = tk.IntVar(value=thr.get("latency_fail", 300))
-        ttk.Spinbox(sec_thr, from_=50, to=2000, textvariable=lat_fail_var, width=6).grid(row=5, column=1, sticky="w", **pad)
+        def build_thresholds(sec: ttk.Frame) -> None:
+            thr = self.config.get("thresholds", {})
+            ttk.Label(sec, text="Signal warn (%):").grid(row=0, column=0, sticky="w", **pad)
+            v["sig_warn"] = tk.IntVar(value=thr.get("signal_warn", 55))
+            ttk.Spinbox(sec, from_=10, to=90, textvariable=v["sig_warn"], width=5).grid(row=0, column=1, sticky="w", **pad)
+            ttk.Label(sec, text="Signal fail (%):").grid(row=1, column=0, sticky="w", **pad)
+            v["sig_fail"] = tk.IntVar(value=thr.get("signal_fail", 35))
+            ttk.Spinbox(sec, from_=5, to=80, textvariable=v["sig_fail"], width=5).grid(row=1, column=1, sticky="w", **pad)
+            ttk.Label(sec, text="Loss warn (%):").grid(row=2, column=0, sticky="w", **pad)
+            v["loss_warn"] = tk.IntVar(value=thr.get("loss_warn", 10))
+            ttk.Spinbox(sec, from_=0, to=100, textvariable=v["loss_warn"], width=5).grid(row=2, column=1, sticky="w", **pad)
+            ttk.Label(sec, text="Loss fail (%):").grid(row=3, column=0, sticky="w", **pad)
+            v["loss_fail"] = tk.IntVar(value=thr.get("loss_fail", 20))
+            ttk.Spinbox(sec, from_=0, to=100, textvariable=v["loss_fail"], width=5).grid(row=3, column=1, sticky="w", **pad)
+            ttk.Label(sec, text="Latency warn (ms):").grid(row=4, column=0, sticky="w", **pad)
+            v["lat_warn"] = tk.IntVar(value=thr.get("latency_warn", 150))
+            ttk.Spinbox(sec, from_=10, to=1000, textvariable=v["lat_warn"], width=6).grid(row=4, column=1, sticky="w", **pad)
+            ttk.Label(sec, text="Latency fail (ms):").grid(row=5, column=0, sticky="w", **pad)
+            v["lat_fail"] = tk.IntVar(value=thr.get("latency_fail", 300))
+            ttk.Spinbox(sec, from_=50, to=2000, textvariable=v["lat_fail"], width=6).grid(row=5, column=1, sticky="w", **pad)
         # Monitoring settings
-        sec_mon = ttk.Frame(nb)
-        nb.add(sec_mon, text="Monitoring")
-        ttk.Label(sec_mon, text="Scan interval (s):").grid(row=0, column=0, sticky="w", **pad)
-        scan_var = tk.IntVar(value=self.config.get("scan_interval", 10))
-        ttk.Spinbox(sec_mon, from_=2, to=60, textvariable=scan_var, width=6).grid(row=0, column=1, sticky="w", **pad)
-        ttk.Label(sec_mon, text="Ping count:").grid(row=1, column=0, sticky="w", **pad)
-        ping_var = tk.IntVar(value=self.config.get("ping_count", 4))
-        ttk.Spinbox(sec_mon, from_=1, to=10, textvariable=ping_var, width=4).grid(row=1, column=1, sticky="w", **pad)
-        ttk.Label(sec_mon, text="Gateway IP:").grid(row=2, column=0, sticky="w", **pad)
-        gw_var = tk.StringVar(value=self.config.get("ping_targets", {}).get("gateway") or "")
-        ttk.Entry(sec_mon, textvariable=gw_var).grid(row=2, column=1, sticky="w", **pad)
-        ttk.Label(sec_mon, text="Remote host:").grid(row=3, column=0, sticky="w", **pad)
-        rem_var = tk.StringVar(value=self.config.get("ping_targets", {}).get("remote", "8.8.8.8"))
-        ttk.Entry(sec_mon, textvariable=rem_var).grid(row=3, column=1, sticky="w", **pad)
+        def build_monitoring(sec: ttk.Frame) -> None:
+            ttk.Label(sec, text="Scan interval (s):").grid(row=0, column=0, sticky="w", **pad)
+            v["scan"] = tk.IntVar(value=self.config.get("scan_interval", 10))
+            ttk.Spinbox(sec, from_=2, to=60, textvariable=v["scan"], width=6).grid(row=0, column=1, sticky="w", **pad)
+            ttk.Label(sec, text="Ping count:").grid(row=1, column=0, sticky="w", **pad)
+            v["ping"] = tk.IntVar(value=self.config.get("ping_count", 4))
+            ttk.Spinbox(sec, from_=1, to=10, textvariable=v["ping"], width=4).grid(row=1, column=1, sticky="w", **pad)
+            ttk.Label(sec, text="Gateway IP:").grid(row=2, column=0, sticky="w", **pad)
+            v["gw"] = tk.StringVar(value=self.config.get("ping_targets", {}).get("gateway") or "")
+            ttk.Entry(sec, textvariable=v["gw"]).grid(row=2, column=1, sticky="w", **pad)
+            ttk.Label(sec, text="Remote host:").grid(row=3, column=0, sticky="w", **pad)
+            v["rem"] = tk.StringVar(value=self.config.get("ping_targets", {}).get("remote", "8.8.8.8"))
+            ttk.Entry(sec, textvariable=v["rem"]).grid(row=3, column=1, sticky="w", **pad)
         # Log settings
-        sec_log = ttk.Frame(nb)
-        nb.add(sec_log, text="Logging")
-        ttk.Label(sec_log, text="Log directory:").grid(row=0, column=0, sticky="w", **pad)
-        logdir_var = tk.StringVar(value=self.config.get("log_dir", "logs"))
-        ttk.Entry(sec_log, textvariable=logdir_var, width=40).grid(row=0, column=1, sticky="w", **pad)
-        ttk.Label(sec_log, text="Retention days:").grid(row=1, column=0, sticky="w", **pad)
-        retain_var = tk.IntVar(value=self.config.get("log_retention_days", 14))
-        ttk.Spinbox(sec_log, from_=1, to=90, textvariable=retain_var, width=5).grid(row=1, column=1, sticky="w", **pad)
-        ttk.Label(sec_log, text="Max log size (MB):").grid(row=2, column=0, sticky="w", **pad)
-        max_mb_var = tk.IntVar(value=self.config.get("max_log_mb", 512))
-        ttk.Spinbox(sec_log, from_=10, to=2048, textvariable=max_mb_var, width=6).grid(row=2, column=1, sticky="w", **pad)
+        def build_logging(sec: ttk.Frame) -> None:
+            ttk.Label(sec, text="Log directory:").grid(row=0, column=0, sticky="w", **pad)
+            v["logdir"] = tk.StringVar(value=self.config.get("log_dir", "logs"))
+            ttk.Entry(sec, textvariable=v["logdir"], width=40).grid(row=0, column=1, sticky="w", **pad)
+            ttk.Label(sec, text="Retention days:").grid(row=1, column=0, sticky="w", **pad)
+            v["retain"] = tk.IntVar(value=self.config.get("log_retention_days", 14))
+            ttk.Spinbox(sec, from_=1, to=90, textvariable=v["retain"], width=5).grid(row=1, column=1, sticky="w", **pad)
+            ttk.Label(sec, text="Max log size (MB):").grid(row=2, column=0, sticky="w", **pad)
+            v["max_mb"] = tk.IntVar(value=self.config.get("max_log_mb", 512))
+            ttk.Spinbox(sec, from_=10, to=2048, textvariable=v["max_mb"], width=6).grid(row=2, column=1, sticky="w", **pad)
         # Notifications settings
-        sec_not = ttk.Frame(nb)
-        nb.add(sec_not, text="Notifications")
-        ncfg = self.config.get("notifications", {})
-        notif_enabled_var = tk.BooleanVar(value=ncfg.get("enabled", True))
-        ttk.Checkbutton(sec_not, text="Enable notifications", variable=notif_enabled_var).grid(row=0, column=0, sticky="w", **pad)
-        ttk.Label(sec_not, text="Signal threshold (%):").grid(row=1, column=0, sticky="w", **pad)
-        notif_sig_var = tk.IntVar(value=ncfg.get("signal_threshold", 35))
-        ttk.Spinbox(sec_not, from_=5, to=90, textvariable=notif_sig_var, width=5).grid(row=1, column=1, sticky="w", **pad)
-        ttk.Label(sec_not, text="Loss threshold (%):").grid(row=2, column=0, sticky="w", **pad)
-        notif_loss_var = tk.IntVar(value=ncfg.get("loss_threshold", 20))
-        ttk.Spinbox(sec_not, from_=0, to=100, textvariable=notif_loss_var, width=5).grid(row=2, column=1, sticky="w", **pad)
-        ttk.Label(sec_not, text="Latency threshold (ms):").grid(row=3, column=0, sticky="w", **pad)
-        notif_lat_var = tk.IntVar(value=ncfg.get("latency_threshold", 200))
-        ttk.Spinbox(sec_not, from_=50, to=2000, textvariable=notif_lat_var, width=6).grid(row=3, column=1, sticky="w", **pad)
-        ttk.Label(sec_not, text="Channels:").grid(row=4, column=0, sticky="w", **pad)
-        notif_channels_var = tk.StringVar(value=",".join(ncfg.get("channels", ["popup"])))
-        ttk.Entry(sec_not, textvariable=notif_channels_var).grid(row=4, column=1, sticky="w", **pad)
+        def build_notifications(sec: ttk.Frame) -> None:
+            ncfg = self.config.get("notifications", {})
+            v["notif_enabled"] = tk.BooleanVar(value=ncfg.get("enabled", True))
+            ttk.Checkbutton(sec, text="Enable notifications", variable=v["notif_enabled"]).grid(row=0, column=0, sticky="w", **pad)
+            ttk.Label(sec, text="Signal threshold (%):").grid(row=1, column=0, sticky="w", **pad)
+            v["notif_sig"] = tk.IntVar(value=ncfg.get("signal_threshold", 35))
+            ttk.Spinbox(sec, from_=5, to=90, textvariable=v["notif_sig"], width=5).grid(row=1, column=1, sticky="w", **pad)
+            ttk.Label(sec, text="Loss threshold (%):").grid(row=2, column=0, sticky="w", **pad)
+            v["notif_loss"] = tk.IntVar(value=ncfg.get("loss_threshold", 20))
+            ttk.Spinbox(sec, from_=0, to=100, textvariable=v["notif_loss"], width=5).grid(row=2, column=1, sticky="w", **pad)
+            ttk.Label(sec, text="Latency threshold (ms):").grid(row=3, column=0, sticky="w", **pad)
+            v["notif_lat"] = tk.IntVar(value=ncfg.get("latency_threshold", 200))
+            ttk.Spinbox(sec, from_=50, to=2000, textvariable=v["notif_lat"], width=6).grid(row=3, column=1, sticky="w", **pad)
+            ttk.Label(sec, text="Channels:").grid(row=4, column=0, sticky="w", **pad)
+            v["notif_channels"] = tk.StringVar(value=",".join(ncfg.get("channels", ["popup"])))
+            ttk.Entry(sec, textvariable=v["notif_channels"]).grid(row=4, column=1, sticky="w", **pad)
         # Speed test settings
-        sec_speed = ttk.Frame(nb)
-        nb.add(sec_speed, text="Speed Test")
-        st = self.config.get("speed_test", {})
-        speed_enabled_var = tk.BooleanVar(value=st.get("enabled", False))
-        ttk.Checkbutton(sec_speed, text="Enable speed test", variable=speed_enabled_var).grid(row=0, column=0, sticky="w", **pad)
-        ttk.Label(sec_speed, text="Test type:").grid(row=1, column=0, sticky="w", **pad)
-        speed_type_var = tk.StringVar(value=st.get("type", "http"))
-        ttk.Combobox(sec_speed, values=["http", "iperf3"], textvariable=speed_type_var, state="readonly")\
-            .grid(row=1, column=1, sticky="w", **pad)
-        ttk.Label(sec_speed, text="HTTP URL:").grid(row=2, column=0, sticky="w", **pad)
-        speed_url_var = tk.StringVar(value=st.get("url", "http://speedtest.tele2.net/1MB.zip"))
-        ttk.Entry(sec_speed, textvariable=speed_url_var, width=40).grid(row=2, column=1, sticky="w", **pad)
-        ttk.Label(sec_speed, text="iPerf3 server:").grid(row=3, column=0, sticky="w", **pad)
-        speed_server_var = tk.StringVar(value=st.get("iperf3_server", ""))
-        ttk.Entry(sec_speed, textvariable=speed_server_var).grid(row=3, column=1, sticky="w", **pad)
-        ttk.Label(sec_speed, text="iPerf3 port:").grid(row=4, column=0, sticky="w", **pad)
-        speed_port_var = tk.IntVar(value=st.get("iperf3_port", 5201))
-        ttk.Spinbox(sec_speed, from_=1, to=65535, textvariable=speed_port_var, width=6).grid(row=4, column=1, sticky="w", **pad)
-        ttk.Label(sec_speed, text="Duration (s):").grid(row=5, column=0, sticky="w", **pad)
-        speed_dur_var = tk.IntVar(value=st.get("duration", 10))
-        ttk.Spinbox(sec_speed, from_=5, to=60, textvariable=speed_dur_var, width=4).grid(row=5, column=1, sticky="w", **pad)
+        def build_speed_test(sec: ttk.Frame) -> None:
+            st = self.config.get("speed_test", {})
+            v["speed_enabled"] = tk.BooleanVar(value=st.get("enabled", False))
+            ttk.Checkbutton(sec, text="Enable speed test", variable=v["speed_enabled"]).grid(row=0, column=0, sticky="w", **pad)
+            ttk.Label(sec, text="Test type:").grid(row=1, column=0, sticky="w", **pad)
+            v["speed_type"] = tk.StringVar(value=st.get("type", "http"))
+            ttk.Combobox(sec, values=["http", "iperf3"], textvariable=v["speed_type"], state="readonly")\
+                .grid(row=1, column=1, sticky="w", **pad)
+            ttk.Label(sec, text="HTTP URL:").grid(row=2, column=0, sticky="w", **pad)
+            v["speed_url"] = tk.StringVar(value=st.get("url", "http://speedtest.tele2.net/1MB.zip"))
+            ttk.Entry(sec, textvariable=v["speed_url"], width=40).grid(row=2, column=1, sticky="w", **pad)
+            ttk.Label(sec, text="iPerf3 server:").grid(row=3, column=0, sticky="w", **pad)
+            v["speed_server"] = tk.StringVar(value=st.get("iperf3_server", ""))
+            ttk.Entry(sec, textvariable=v["speed_server"]).grid(row=3, column=1, sticky="w", **pad)
+            ttk.Label(sec, text="iPerf3 port:").grid(row=4, column=0, sticky="w", **pad)
+            v["speed_port"] = tk.IntVar(value=st.get("iperf3_port", 5201))
+            ttk.Spinbox(sec, from_=1, to=65535, textvariable=v["speed_port"], width=6).grid(row=4, column=1, sticky="w", **pad)
+            ttk.Label(sec, text="Duration (s):").grid(row=5, column=0, sticky="w", **pad)
+            v["speed_dur"] = tk.IntVar(value=st.get("duration", 10))
+            ttk.Spinbox(sec, from_=5, to=60, textvariable=v["speed_dur"], width=4).grid(row=5, column=1, sticky="w", **pad)
         # Scheduled diagnostics settings
-        sec_sched = ttk.Frame(nb)
-        nb.add(sec_sched, text="Scheduled Diagnostics")
-        sched = self.config.get("scheduled_diagnostics", {})
-        sched_enabled_var = tk.BooleanVar(value=sched.get("enabled", False))
-        ttk.Checkbutton(sec_sched, text="Enable scheduled diagnostics", variable=sched_enabled_var).grid(row=0, column=0, sticky="w", **pad)
-        ttk.Label(sec_sched, text="Interval (hours):").grid(row=1, column=0, sticky="w", **pad)
-        sched_interval_var = tk.IntVar(value=sched.get("interval_hours", 12))
-        ttk.Spinbox(sec_sched, from_=1, to=24*7, textvariable=sched_interval_var, width=5).grid(row=1, column=1, sticky="w", **pad)
+        def build_scheduled_diagnostics(sec: ttk.Frame) -> None:
+            sched = self.config.get("scheduled_diagnostics", {})
+            v["sched_enabled"] = tk.BooleanVar(value=sched.get("enabled", False))
+            ttk.Checkbutton(sec, text="Enable scheduled diagnostics", variable=v["sched_enabled"]).grid(row=0, column=0, sticky="w", **pad)
+            ttk.Label(sec, text="Interval (hours):").grid(row=1, column=0, sticky="w", **pad)
+            v["sched_interval"] = tk.IntVar(value=sched.get("interval_hours", 12))
+            ttk.Spinbox(sec, from_=1, to=24*7, textvariable=v["sched_interval"], width=5).grid(row=1, column=1, sticky="w", **pad)
+        # Use Notebook inside settings to organise sections
+        nb = ttk.Notebook(frame)
+        nb.pack(fill=tk.BOTH, expand=True)
+        self._settings_nb = nb
+        # Section frame path -> (config section, builder), until built
+        self._settings_sections: Dict[str, Tuple[str, Callable[[ttk.Frame], None]]] = {}
+        self._settings_built: set = set()
+        for title, key, builder in (
+            ("Appearance", "appearance", build_appearance),
+            ("Dashboard", "dashboard_layout", build_dashboard_layout),
+            ("Thresholds", "thresholds", build_thresholds),
+            ("Monitoring", "monitoring", build_monitoring),
+            ("Logging", "logging", build_logging),
+            ("Notifications", "notifications", build_notifications),
+            ("Speed Test", "speed_test", build_speed_test),
+            ("Scheduled Diagnostics", "scheduled_diagnostics", build_scheduled_diagnostics),
+        ):
+            placeholder = ttk.Frame(nb)
+            nb.add(placeholder, text=title)
+            self._settings_sections[str(placeholder)] = (key, builder)
+        nb.bind("<<NotebookTabChanged>>", self._maybe_build_settings_section)
+        # The first section was selected before the binding existed
+        self._maybe_build_settings_section()
         # Save button
         def save_settings():
-            # Update config dict
-            self.config["appearance"] = {
-                "theme": theme_var.get(),
-                "accent_color": accent_var.get(),
-                "font_size": font_var.get(),
-            }
-            self.config["dashboard_layout"] = {
-                "show_signal": self.var_show_signal.get(),
-                "show_latency": self.var_show_latency.get(),
-                "show_roams": self.var_show_roams.get(),
-                "show_throughput": self.var_show_throughput.get(),
-                "show_charts": self.var_show_charts.get(),
-            }
-            self.config["thresholds"] = {
-                "signal_warn": sig_warn_var.get(),
-                "signal_fail": sig_fail_var.get(),
-                "loss_warn": loss_warn_var.get(),
-                "loss_fail": loss_fail_var.get(),
-                "latency_warn": lat_warn_var.get(),
-                "latency_fail": lat_fail_var.get(),
-            }
-            self.config["scan_interval"] = scan_var.get()
-            self.config["ping_count"] = ping_var.get()
-            self.config["ping_targets"] = {
-                "gateway": gw_var.get() or None,
-                "remote": rem_var.get() or None,
-            }
-            self.config["log_dir"] = logdir_var.get()
-            self.config["log_retention_days"] = retain_var.get()
-            self.config["max_log_mb"] = max_mb_var.get()
-            self.config["notifications"] = {
-                "enabled": notif_enabled_var.get(),
-                "signal_threshold": notif_sig_var.get(),
-                "loss_threshold": notif_loss_var.get(),
-                "latency_threshold": notif_lat_var.get(),
-                "channels": [c.strip() for c in notif_channels_var.get().split(',') if c.strip()],
-            }
-            self.config["speed_test"] = {
-                "enabled": speed_enabled_var.get(),
-                "type": speed_type_var.get(),
-                "url": speed_url_var.get(),
-                "iperf3_server": speed_server_var.get(),
-                "iperf3_port": speed_port_var.get(),
-                "duration": speed_dur_var.get(),
-            }
-            self.config["scheduled_diagnostics"] = {
-                "enabled": sched_enabled_var.get(),
-                "interval_hours": sched_interval_var.get(),
-            }
-            # Save to YAML
-            save_config(self.config)
+            # Snapshot to tell which settings actually changed
+            old = copy.deepcopy(self.config)
+            # Update config dict from the sections that were built; the
+            # others were never shown, so their settings are unchanged
+            built = self._settings_built
+            if "appearance" in built:
+                self.config["appearance"] = {
+                    "theme": v["theme"].get(),
+                    "accent_color": v["accent"].get(),
+                    "font_size": v["font"].get(),
+                    "chart_update_every_n_scans": v["chart_every"].get(),
+                }
+            if "dashboard_layout" in built:
+                self.config["dashboard_layout"] = {
+                    "show_signal": v["show_signal"].get(),
+                    "show_latency": v["show_latency"].get(),
+                    "show_roams": v["show_roams"].get(),
+                    "show_throughput": v["show_throughput"].get(),
+                    "show_charts": v["show_charts"].get(),
+                }
+            if "thresholds" in built:
+                self.config["thresholds"] = {
+                    "signal_warn": v["sig_warn"].get(),
+                    "signal_fail": v["sig_fail"].get(),
+                    "loss_warn": v["loss_warn"].get(),
+                    "loss_fail": v["loss_fail"].get(),
+                    "latency_warn": v["lat_warn"].get(),
+                    "latency_fail": v["lat_fail"].get(),
+                }
+            if "monitoring" in built:
+                self.config["scan_interval"] = v["scan"].get()
+                self.config["ping_count"] = v["ping"].get()
+                self.config["ping_targets"] = {
+                    "gateway": v["gw"].get() or None,
+                    "remote": v["rem"].get() or None,
+                }
+            if "logging" in built:
+                self.config["log_dir"] = v["logdir"].get()
+                self.config["log_retention_days"] = v["retain"].get()
+                self.config["max_log_mb"] = v["max_mb"].get()
+            if "notifications" in built:
+                self.config["notifications"] = {
+                    "enabled": v["notif_enabled"].get(),
+                    "signal_threshold": v["notif_sig"].get(),
+                    "loss_threshold": v["notif_loss"].get(),
+                    "latency_threshold": v["notif_lat"].get(),
+                    "channels": [c.strip() for c in v["notif_channels"].get().split(',') if c.strip()],
+                    "min_interval_sec": self.config.get("notifications", {}).get("min_interval_sec", 30),
+                }
+            if "speed_test" in built:
+                self.config["speed_test"] = {
+                    "enabled": v["speed_enabled"].get(),
+                    "type": v["speed_type"].get(),
+                    "url": v["speed_url"].get(),
+                    "iperf3_server": v["speed_server"].get(),
+                    "iperf3_port": v["speed_port"].get(),
+                    "duration": v["speed_dur"].get(),
+                }
+            if "scheduled_diagnostics" in built:
+                self.config["scheduled_diagnostics"] = {
+                    "enabled": v["sched_enabled"].get(),
+                    "interval_hours": v["sched_interval"].get(),
+                }
+            # Nothing to save or reapply when the settings are unchanged
+            if self.config == old:
+                messagebox.showinfo("Settings", "No changes to save.")
+                return
+            # Write the YAML off the UI thread
+            save_config_async(copy.deepcopy(self.config))
+            # The running monitor shares this config dict; refresh its
+            # cached notification thresholds
+            self.monitor.reload_thresholds()
             # Reapply theme and refresh UI
-            self._apply_theme()
-            # Possibly restart monitor thread with new settings
-            self._stop_monitor()
-            self._start_monitor()
+            if self.config.get("appearance") != old.get("appearance"):
+                self._apply_theme()
+            # Restart the monitor only for settings it reads at start‑up
+            if any(self.config.get(k) != old.get(k) for k in self.MONITOR_RESTART_KEYS):
+                self._restart_monitor()
             messagebox.showinfo("Settings", "Settings saved. Some changes may require restarting the application.")
         ttk.Button(frame, text="Save Settings", command=save_settings).pack(pady=(4, 10))
 
+    def _maybe_build_settings_section(self, event=None) -> None:
+        """Build the widgets of the selected Settings section on first show."""
+        current = self._settings_nb.select()
+        section = self._settings_sections.pop(current, None)
+        if section is not None:
+            key, builder = section
+            builder(self.nametowidget(current))
+            self._settings_built.add(key)
+
     ############################################################################
     # Report Generation
     ############################################################################
+    def _report_figure(self):
+        """Return the report chart figure and its three axes, cleared.
+
+        The figure is created on first use and reused by later reports.
+        """
+        if self._report_fig is None:
+            fig = Figure(figsize=(6, 4), dpi=100)
+            self._report_fig = fig
+            self._report_axes = (fig.add_subplot(311), fig.add_subplot(312), fig.add_subplot(313))
+        for ax in self._report_axes:
+            ax.clear()
+        return self._report_fig, self._report_axes
+
     def generate_report(self) -> None:
-        """Generate a simple HTML report summarising recent diagnostics and logs."""
+        """Generate a simple HTML report summarising recent diagnostics and logs.
+
+        Only the file dialog and the final message box run on the UI thread;
+        the charts are rendered and the file written by a worker thread.
+        """
         save_path = filedialog.asksaveasfilename(title="Save Report", defaultextension=".html",
                                                 filetypes=[("HTML Files", "*.html")])
         if not save_path:
             return
-        try:
+        issues = list(self.current_issues)
+        def worker():
+            try:
+                # One report at a time: they share the chart figure
+                with self._report_lock:
+                    self._write_report(save_path, issues)
+            except Exception as e:
+                msg = f"Failed to generate report: {e}"
+                self.after(0, lambda: messagebox.showerror("Report", msg))
+            else:
+                self.after(0, lambda: messagebox.showinfo("Report", f"Report saved to {save_path}"))
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _write_report(self, save_path: str, issues: List[Tuple[str, str]]) -> None:
+        """Render the HTML report for ``issues`` to ``save_path``.
+
+        Fragments are written to the file as they are produced, and the
+        chart is base64‑encoded straight from the PNG buffer in slices, so
+        the image is never held as one large string.
+        """
+        with open(save_path, "w", encoding="utf-8") as f:
+            def w(fragment: str) -> None:
+                f.write(fragment)
+                f.write("\n")
             # Compose HTML
-            html = ["<html><head><meta charset='utf-8'><title>Wi‑Fi Report</title>\n" +
-                    "<style>body{font-family:sans-serif;margin:20px;}h1,h2{color:#0f172a;}"
-                    "table{border-collapse:collapse;width:100%;}th,td{border:1px solid #ccc;padding:4px;text-align:left;}"
-                    "th{background-color:#f8fafc;}" +
-                    "</style></head><body>"]
-            html.append("<h1>Wi‑Fi Diagnostics Report</h1>")
-            html.append(f"<p>Generated: {datetime.now(timezone.utc).isoformat()}</p>")
+            w("<html><head><meta charset='utf-8'><title>Wi‑Fi Report</title>\n"
+              "<style>body{font-family:sans-serif;margin:20px;}h1,h2{color:#0f172a;}"
+              "table{border-collapse:collapse;width:100%;}th,td{border:1px solid #ccc;padding:4px;text-align:left;}"
+              "th{background-color:#f8fafc;}"
+              "</style></head><body>")
+            w("<h1>Wi‑Fi Diagnostics Report</h1>")
+            w(f"<p>Generated: {datetime.now(timezone.utc).isoformat()}</p>")
             # Summary of signal and latency over last 10 minutes
-            html.append("<h2>Recent Signal & Latency</h2>")
+            w("<h2>Recent Signal & Latency</h2>")
             # Generate charts as PNG and embed base64
-            buf = io.BytesIO()
-            fig = Figure(figsize=(6, 4), dpi=100)
-            ax1 = fig.add_subplot(311)
-            ax2 = fig.add_subplot(312)
-            ax3 = fig.add_subplot(313)
-            xs = list(range(len(self.monitor.buf_signal)))
-            ax1.plot(xs, list(self.monitor.buf_signal), color="#2563eb"); ax1.set_title("Signal (%)")
+            # Reuse the PNG buffer of earlier reports
+            buf = self._report_buf
+            buf.seek(0)
+            buf.truncate()
+            fig, (ax1, ax2, ax3) = self._report_figure()
+            bufs = self.monitor.snapshot_buffers()
+            sig, gw_lat, rem_lat = bufs["signal"], bufs["ping_gw"], bufs["ping_rem"]
+            xs = np.arange(len(sig))
+            ax1.plot(xs, sig, color="#2563eb"); ax1.set_title("Signal (%)")
             ax1.set_ylim(0, 100)
-            ax2.plot(xs, list(self.monitor.buf_ping_gw), color="#047857"); ax2.set_title("Gateway Latency (ms)")
-            ax3.plot(xs, list(self.monitor.buf_ping_rem), color="#be185d"); ax3.set_title("Internet Latency (ms)")
+            ax2.plot(xs, gw_lat, color="#047857"); ax2.set_title("Gateway Latency (ms)")
+            ax3.plot(xs, rem_lat, color="#be185d"); ax3.set_title("Internet Latency (ms)")
             fig.tight_layout()
-            fig.savefig(buf, format="png")
-            data_uri = base64.b64encode(buf.getvalue()).decode('utf-8')
-            html.append(f"<img src='data:image/png;base64,{data_uri}' alt='Charts'/>")
+            # Fast zlib level: the PNG is embedded once, size hardly matters
+            fig.savefig(buf, format="png", dpi=80, pil_kwargs={"compress_level": 1})
+            if Image is not None:
+                # Re‑encode as a palette PNG, several times smaller than RGBA,
+                # which shrinks the base64 payload by the same factor
+                buf.seek(0)
+                with Image.open(buf) as im:
+                    pal = im.convert("RGB").quantize(colors=_REPORT_PNG_COLOURS)
+                buf.seek(0)
+                buf.truncate()
+                pal.save(buf, "PNG", optimize=True)
+            f.write("<img src='data:image/png;base64,")
+            # Slices are a multiple of 3 bytes, so their encodings concatenate;
+            # the view is released so the buffer can be truncated next time
+            with buf.getbuffer() as png:
+                for i in range(0, len(png), _REPORT_B64_CHUNK):
+                    f.write(base64.b64encode(png[i:i + _REPORT_B64_CHUNK]).decode("ascii"))
+            w("' alt='Charts'/>")
             # Diagnostics summary
-            html.append("<h2>Diagnostics Summary</h2>")
-            html.append("<ul>")
-            for sev, iid in sorted(self.current_issues, key=lambda x: x[0], reverse=True):
+            w("<h2>Diagnostics Summary</h2>")
+            w("<ul>")
+            for sev, iid in sorted(issues, key=lambda x: x[0], reverse=True):
                 entry = self.db.get(iid, {})
-                html.append(f"<li><strong>{sev}</strong>: {entry.get('title')}</li>")
-            html.append("</ul>")
+                w(f"<li><strong>{sev}</strong>: {entry.get('title')}</li>")
+            w("</ul>")
             # Speed test result
             if self.monitor.last_speed_test is not None:
-                html.append("<h2>Speed Test</h2>")
-                html.append(f"<p>Download speed: {self.monitor.last_speed_test:.1f} Mbps</p>")
+                w("<h2>Speed Test</h2>")
+                w(f"<p>Download speed: {self.monitor.last_speed_test:.1f} Mbps</p>")
             # Log statistics
-            html.append("<h2>Log Statistics</h2>")
+            w("<h2>Log Statistics</h2>")
             try:
-                csv_path = Path(self.config["log_dir"]) / "wifi_log.csv"
-                avg_sig = sum([s for s in self.monitor.buf_signal if not math.isnan(s)]) / max(1, len([s for s in self.monitor.buf_signal if not math.isnan(s)]))
-                avg_gw_lat = sum([g for g in self.monitor.buf_ping_gw if not math.isnan(g)]) / max(1, len([g for g in self.monitor.buf_ping_gw if not math.isnan(g)]))
-                avg_rem_lat = sum([r for r in self.monitor.buf_ping_rem if not math.isnan(r)]) / max(1, len([r for r in self.monitor.buf_ping_rem if not math.isnan(r)]))
-                html.append(f"<p>Average signal: {avg_sig:.1f}%</p>")
-                html.append(f"<p>Average gateway latency: {avg_gw_lat:.1f} ms</p>")
-                html.append(f"<p>Average internet latency: {avg_rem_lat:.1f} ms</p>")
+                stats = self.monitor.stats
+                avg_sig = stats["signal"].mean() or 0.0
+                avg_gw_lat = stats["ping_gw"].mean() or 0.0
+                avg_rem_lat = stats["ping_rem"].mean() or 0.0
+                w(f"<p>Average signal: {avg_sig:.1f}%</p>")
+                w(f"<p>Average gateway latency: {avg_gw_lat:.1f} ms</p>")
+                w(f"<p>Average internet latency: {avg_rem_lat:.1f} ms</p>")
             except Exception:
                 pass
-            html.append("</body></html>")
-            with open(save_path, "w", encoding="utf-8") as f:
-                f.write("\n".join(html))
-            messagebox.showinfo("Report", f"Report saved to {save_path}")
-        except Exception as e:
-            messagebox.showerror("Report", f"Failed to generate report: {e}")
+            f.write("</body></html>")
 
     ############################################################################
     # UI update loop
     ############################################################################
     def _ui_update_loop(self) -> None:
         """Periodic UI refresh; schedules itself."""
-        # Reschedule
-        self.after(1000, self._ui_update_loop)
+        # Reschedule, slowly while the window is minimised
+        self.after(1000 if self._window_mapped else 5000, self._ui_update_loop)
         # Could add periodic tasks here if needed
 
+    def _on_window_map(self, event) -> None:
+        """Track minimising/restoring the main window.
+
+        While minimised, summaries are only stashed and network scans
+        stop; restoring the window catches the current tab up.
+        """
+        # Child widgets' Map/Unmap events also reach the toplevel binding
+        if event.widget is not self:
+            return
+        self._window_mapped = event.type == tk.EventType.Map
+        self._on_tab_changed()
+
     ############################################################################
     # Window close handler
     ############################################################################
     def on_close(self) -> None:
         """Stop background threads and close the application."""
         self._stop_monitor()
+        self.monitor.flush_logs()
         self.destroy()
 
 